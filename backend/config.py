@@ -38,6 +38,13 @@ TRUST_WEIGHTS = {
     "content_quality": 0.15,
     "temporal_consistency": 0.15,
 }
+TRUST_KEYS = (
+    "authenticity",
+    "sentiment_quality",
+    "reviewer_credibility",
+    "content_quality",
+    "temporal_consistency",
+)
 
 # Application Configuration
 DEFAULT_PORT = 8080
@@ -11,14 +11,18 @@ Exports use British English class names by default, with backwards-compatible
 aliases for the original American spellings.
 """
 
-from .review_analyser import ReviewAnalyser
-from .sentiment_analyser import SentimentAnalyser
-from .fake_detector import FakeReviewDetector
-from .trust_scorer import TrustScorer
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-# Backwards-compatible aliases (American spelling)
-ReviewAnalyzer = ReviewAnalyser  # type: ignore
-SentimentAnalyzer = SentimentAnalyser  # type: ignore
+if TYPE_CHECKING:
+    from .review_analyser import ReviewAnalyser
+    from .sentiment_analyser import SentimentAnalyser
+    from .fake_detector import FakeReviewDetector
+    from .trust_scorer import TrustScorer
+
+    # Backwards-compatible aliases (American spelling)
+    ReviewAnalyzer = ReviewAnalyser  # type: ignore
+    SentimentAnalyzer = SentimentAnalyser  # type: ignore
 
 __all__ = [
     "ReviewAnalyser",
@@ -29,3 +33,28 @@ __all__ = [
     "ReviewAnalyzer",
     "SentimentAnalyzer",
 ]
+
+# Export name -> (submodule, class name). Submodules are imported on first
+# access, so importing one service does not load the others' NLP dependencies
+_EXPORTS = {
+    "ReviewAnalyser": ("review_analyser", "ReviewAnalyser"),
+    "SentimentAnalyser": ("sentiment_analyser", "SentimentAnalyser"),
+    "FakeReviewDetector": ("fake_detector", "FakeReviewDetector"),
+    "TrustScorer": ("trust_scorer", "TrustScorer"),
+    "ReviewAnalyzer": ("review_analyser", "ReviewAnalyser"),
+    "SentimentAnalyzer": ("sentiment_analyser", "SentimentAnalyser"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
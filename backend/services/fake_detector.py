@@ -1,6 +1,34 @@
 import numpy as np  # type: ignore
 import re
-from typing import Dict, List, Optional, Any
+from collections import Counter, defaultdict
+from numbers import Real
+from typing import DefaultDict, Dict, List, Optional, Any
+
+from ..utils.caching import FrozenArg, cached_method
+
+# Maximum number of memoised results kept per detector instance
+_CACHE_SIZE = 4096
+
+# Keyword lists are lowercase so they can be tested against text.lower()
+_GENERIC_PHRASES = (
+    "good service",
+    "nice place",
+    "friendly staff",
+    "great food",
+    "bad experience",
+    "poor service",
+    "would not recommend",
+)
+_EMOTIONAL_WORDS = frozenset(
+    {"amazing", "terrible", "perfect", "worst", "best", "horrible"}
+)
+
+
+def _is_score(value: Any) -> bool:
+    """
+    Whether value is a real number usable as a trust score (bools excluded).
+    """
+    return isinstance(value, Real) and not isinstance(value, bool)
 
 
 class FakeReviewDetector:
@@ -22,106 +50,164 @@ class FakeReviewDetector:
             r"\b(\w+)\s+\1\b",  # Repeated words
         ]
 
+        # Compile once so the per-review scans skip the re module's cache lookup
+        self._suspicious_res = [
+            re.compile(p, re.IGNORECASE) for p in self.suspicious_patterns
+        ]
+        self._bot_res = [re.compile(p, re.IGNORECASE) for p in self.bot_indicators]
+        # Single alternation used to rule out clean text in one pass; the
+        # suspicious patterns have no backreferences so they can be joined as-is
+        self._suspicious_union = re.compile(
+            "|".join(f"(?:{p})" for p in self.suspicious_patterns), re.IGNORECASE
+        )
+        self._repeat_word_re = re.compile(r"\b(\w+)\b(?:\s+\1\b){1,}", re.IGNORECASE)
+
+        # Per-instance memo tables, dropped together with the detector
+        self._detect_cached = cached_method(self._detect_from_key, _CACHE_SIZE)
+        self._risk_cached = cached_method(self._risk_from_key, _CACHE_SIZE)
+
     def detect_fake_review(
         self, review_text: Any, reviewer_data: Optional[Dict[str, Any]] = None
     ) -> float:
         """
         Calculate probability that a review is fake (0-1 scale)
+
+        Results are memoised per detector on the review text and reviewer data.
+        """
+        self._validate_inputs(review_text, reviewer_data)
+        try:
+            reviewer_key = FrozenArg(reviewer_data)
+        except TypeError:
+            # Reviewer data holds something unhashable; skip the cache
+            return self._score_fake_review(review_text, reviewer_data)
+        return self._detect_cached(review_text, reviewer_key)
+
+    def detect_fake_reviews(
+        self,
+        review_texts: List[str],
+        reviewer_data_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> np.ndarray:
+        """
+        Calculate fake probabilities for a batch of reviews
+
+        Args:
+            review_texts: Review texts to score
+            reviewer_data_list: Optional reviewer data aligned with review_texts
+
+        Returns:
+            Array of fake probabilities, one per review
+        """
+        if reviewer_data_list is None:
+            reviewer_data_list = [None] * len(review_texts)
+        elif len(reviewer_data_list) != len(review_texts):
+            raise ValueError("reviewer_data_list must match review_texts in length")
+
+        # Bind hot lookups once for the whole batch
+        detect_cached = self._detect_cached
+        score_uncached = self._score_fake_review
+        out = np.empty(len(review_texts), dtype=np.float64)
+
+        for i, (review_text, reviewer_data) in enumerate(
+            zip(review_texts, reviewer_data_list)
+        ):
+            self._validate_inputs(review_text, reviewer_data)
+            try:
+                reviewer_key = FrozenArg(reviewer_data)
+            except TypeError:
+                out[i] = score_uncached(review_text, reviewer_data)
+                continue
+            out[i] = detect_cached(review_text, reviewer_key)
+
+        return out
+
+    @staticmethod
+    def _validate_inputs(review_text: Any, reviewer_data: Any) -> None:
+        """
+        Reject inputs the scoring helpers cannot handle, so they run unguarded
         """
         if not isinstance(review_text, str):
-            # Let invalid input raise for tests that expect exceptions
             raise TypeError("review_text must be a string")
-        try:
-            # Text-based analysis
-            text_suspicion = self._analyze_text_patterns(review_text)
+        if reviewer_data is not None and not isinstance(reviewer_data, dict):
+            raise TypeError("reviewer_data must be a dict or None")
 
-            # Reviewer behavioral analysis
-            behavior_suspicion = 0.0
-            if reviewer_data:
-                behavior_suspicion = self._analyze_reviewer_behavior(reviewer_data)
+    def _detect_from_key(self, review_text: str, reviewer_key: FrozenArg) -> float:
+        return self._score_fake_review(review_text, reviewer_key.value)
 
-            # Network analysis (simplified)
-            network_suspicion = (
-                self._simple_network_analysis(reviewer_data) if reviewer_data else 0.0
-            )
+    def _score_fake_review(
+        self, review_text: str, reviewer_data: Optional[Dict[str, Any]]
+    ) -> float:
+        """
+        Uncached fake-probability calculation behind detect_fake_review
+        """
+        # Text-based analysis
+        text_suspicion = self._analyze_text_patterns(review_text)
 
-            # Combine suspicion scores
-            if reviewer_data:
-                combined_suspicion = (
-                    text_suspicion * 0.45
-                    + behavior_suspicion * 0.35
-                    + network_suspicion * 0.2
-                )
-            else:
-                # When no reviewer context, lean more on text evidence
-                combined_suspicion = text_suspicion * 0.8 + network_suspicion * 0.2
+        # Reviewer behavioral analysis
+        behavior_suspicion = 0.0
+        if reviewer_data:
+            behavior_suspicion = self._analyze_reviewer_behavior(reviewer_data)
 
-            return min(1.0, max(0.0, combined_suspicion))
+        # Network analysis (simplified)
+        network_suspicion = (
+            self._simple_network_analysis(reviewer_data) if reviewer_data else 0.0
+        )
 
-        except Exception as e:
-            print(f"Error detecting fake review: {e}")
-            return 0.5  # Default uncertain score
+        # Combine suspicion scores
+        if reviewer_data:
+            combined_suspicion = (
+                text_suspicion * 0.45
+                + behavior_suspicion * 0.35
+                + network_suspicion * 0.2
+            )
+        else:
+            # When no reviewer context, lean more on text evidence
+            combined_suspicion = text_suspicion * 0.8 + network_suspicion * 0.2
+
+        return min(1.0, max(0.0, combined_suspicion))
 
     def _analyze_text_patterns(self, text: str) -> float:
         """
         Analyze text patterns for fake review indicators
         """
-        if not text:
-            return 0.8  # Empty text is suspicious
+        if not text.strip():
+            return 0.8  # Empty or whitespace-only text is suspicious
 
         suspicion_score = 0.0
 
-        # Check for suspicious patterns
-        for pattern in self.suspicious_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                suspicion_score += 0.2
+        # Check for suspicious patterns (tally each one only if any matched)
+        if self._suspicious_union.search(text):
+            for pat in self._suspicious_res:
+                if pat.search(text):
+                    suspicion_score += 0.2
 
         # Check for bot-like patterns
-        for pattern in self.bot_indicators:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pat in self._bot_res:
+            if pat.search(text):
                 suspicion_score += 0.25
 
-        # Length analysis
+        lowered = text.lower()
         word_count = len(text.split())
+
+        # Length analysis
         if word_count < 3:
             suspicion_score += 0.35
         elif word_count > 500:
             suspicion_score += 0.1
 
         # Generic language detection
-        generic_phrases = [
-            "good service",
-            "nice place",
-            "friendly staff",
-            "great food",
-            "bad experience",
-            "poor service",
-            "would not recommend",
-        ]
-
-        generic_count = sum(
-            1 for phrase in generic_phrases if phrase.lower() in text.lower()
-        )
+        generic_count = sum(1 for phrase in _GENERIC_PHRASES if phrase in lowered)
         if generic_count > 2:
             suspicion_score += 0.25
 
         # Check for emotional manipulation
-        emotional_words = [
-            "amazing",
-            "terrible",
-            "perfect",
-            "worst",
-            "best",
-            "horrible",
-        ]
-        emotional_density = sum(
-            1 for word in emotional_words if word.lower() in text.lower()
-        ) / len(text.split())
+        emotional_density = (
+            sum(1 for word in _EMOTIONAL_WORDS if word in lowered) / word_count
+        )
         if emotional_density > 0.15:
             suspicion_score += 0.25
 
         # Repeated sentiment words (e.g., "amazing amazing amazing")
-        if re.search(r"\b(\w+)\b(?:\s+\1\b){1,}", text, re.IGNORECASE):
+        if self._repeat_word_re.search(text):
             suspicion_score += 0.2
 
         return min(1.0, suspicion_score)
@@ -202,18 +288,16 @@ class FakeReviewDetector:
         Returns:
             Maximum number of reviews posted on any single day
         """
-        try:
-            dates = [review.get("date", "") for review in reviews if review.get("date")]
-            date_counts: Dict[str, int] = {}
-
-            for date_str in dates:
-                date_only = date_str.split(" ")[0]  # Get just the date part
-                date_counts[date_only] = date_counts.get(date_only, 0) + 1
-
-            return max(date_counts.values()) if date_counts else 0
-        except:
+        if not reviews:
             return 0
 
+        date_counts = Counter(
+            review["date"].split(" ", 1)[0]  # Get just the date part
+            for review in reviews
+            if isinstance(review.get("date"), str) and review["date"]
+        )
+        return max(date_counts.values(), default=0)
+
     def detect_temporal_anomalies(
         self, trust_trends: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -226,42 +310,44 @@ class FakeReviewDetector:
         Returns:
             List of detected anomalies with details
         """
-        try:
-            if len(trust_trends) < 10:
-                return []
-
-            # Extract trust scores and timestamps
-            scores = [trend["trust_score"] for trend in trust_trends]
-            timestamps = [trend["timestamp"] for trend in trust_trends]
-
-            # Simple anomaly detection using z-score
-            mean_score = float(np.mean(scores))
-            std_score = float(np.std(scores))
-
-            anomalies: List[Dict[str, Any]] = []
-            for score, timestamp in zip(scores, timestamps):
-                if std_score > 0:
-                    z_score = abs(score - mean_score) / std_score
-                    if z_score > 2:  # Anomaly threshold
-                        anomalies.append(
-                            {
-                                "timestamp": timestamp,
-                                "trust_score": score,
-                                "anomaly_type": "score_outlier",
-                                "severity": min(1.0, z_score / 3),
-                            }
-                        )
-
-            # Detect review bombing patterns
-            bombing_anomalies = self._detect_review_bombing(trust_trends)
-            anomalies.extend(bombing_anomalies)
-
-            return anomalies
-
-        except Exception as e:
-            print(f"Error detecting temporal anomalies: {e}")
+        # Every trend needs a numeric trust score; timestamps may be missing
+        # (bulk analysis passes None) and only matter for review bombing
+        if len(trust_trends) < 10 or not all(
+            _is_score(trend.get("trust_score")) for trend in trust_trends
+        ):
             return []
 
+        # Extract trust scores and timestamps
+        scores = np.fromiter(
+            (trend["trust_score"] for trend in trust_trends),
+            dtype=np.float64,
+            count=len(trust_trends),
+        )
+        timestamps = [trend.get("timestamp") for trend in trust_trends]
+
+        # Simple anomaly detection using z-score, computed for all points at once
+        mean_score = scores.mean()
+        std_score = scores.std()
+
+        anomalies: List[Dict[str, Any]] = []
+        if std_score > 0:
+            z_scores = np.abs(scores - mean_score) / std_score
+            for i in np.flatnonzero(z_scores > 2):  # Anomaly threshold
+                anomalies.append(
+                    {
+                        "timestamp": timestamps[i],
+                        "trust_score": float(scores[i]),
+                        "anomaly_type": "score_outlier",
+                        "severity": min(1.0, float(z_scores[i]) / 3),
+                    }
+                )
+
+        # Detect review bombing patterns
+        bombing_anomalies = self._detect_review_bombing(trust_trends)
+        anomalies.extend(bombing_anomalies)
+
+        return anomalies
+
     def _detect_review_bombing(
         self, trust_trends: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -276,45 +362,41 @@ class FakeReviewDetector:
         """
         anomalies: List[Dict[str, Any]] = []
 
-        try:
-            # Group reviews by day
-            daily_reviews: Dict[str, List[Dict[str, Any]]] = {}
-            for trend in trust_trends:
-                timestamp = trend["timestamp"]
-                date_key = (
-                    timestamp.split("T")[0]
-                    if "T" in timestamp
-                    else timestamp.split(" ")[0]
+        # Group reviews by day
+        daily_reviews: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for trend in trust_trends:
+            timestamp = trend.get("timestamp")
+            if not isinstance(timestamp, str):
+                continue  # Undated reviews cannot be grouped by day
+            date_key, separator, _ = timestamp.partition("T")
+            if not separator:
+                date_key = timestamp.partition(" ")[0]
+            daily_reviews[date_key].append(trend)
+
+        # Check for unusual daily volumes; averages are only built for
+        # the days that clear the threshold
+        daily_counts = {date: len(reviews) for date, reviews in daily_reviews.items()}
+        if daily_counts:
+            mean_daily = sum(daily_counts.values()) / len(daily_counts)
+            threshold = mean_daily * 3  # 3x normal volume
+            severity_scale = mean_daily * 5
+
+            for date, count in daily_counts.items():
+                if count <= threshold:
+                    continue
+                avg_trust = float(
+                    sum(r["trust_score"] for r in daily_reviews[date]) / count
                 )
 
-                if date_key not in daily_reviews:
-                    daily_reviews[date_key] = []
-                daily_reviews[date_key].append(trend)
-
-            # Check for unusual daily volumes
-            daily_counts = [len(reviews) for reviews in daily_reviews.values()]
-            if daily_counts:
-                mean_daily = float(np.mean(daily_counts))
-
-                for date, reviews in daily_reviews.items():
-                    if len(reviews) > mean_daily * 3:  # 3x normal volume
-                        trust_scores = [r["trust_score"] for r in reviews]
-                        avg_trust = float(np.mean(trust_scores))
-
-                        anomalies.append(
-                            {
-                                "timestamp": date,
-                                "trust_score": avg_trust,
-                                "anomaly_type": "review_bombing",
-                                "severity": min(
-                                    1.0, float(len(reviews) / (mean_daily * 5))
-                                ),
-                                "review_count": len(reviews),
-                            }
-                        )
-
-        except Exception as e:
-            print(f"Error detecting review bombing: {e}")
+                anomalies.append(
+                    {
+                        "timestamp": date,
+                        "trust_score": avg_trust,
+                        "anomaly_type": "review_bombing",
+                        "severity": min(1.0, float(count / severity_scale)),
+                        "review_count": count,
+                    }
+                )
 
         return anomalies
 
@@ -324,6 +406,26 @@ class FakeReviewDetector:
         """
         Get detailed risk factor breakdown
         """
+        self._validate_inputs(review_text, reviewer_data)
+        try:
+            reviewer_key = FrozenArg(reviewer_data)
+        except TypeError:
+            # Reviewer data holds something unhashable; skip the cache
+            return self._compute_risk_factors(review_text, reviewer_data)
+        # Hand out a copy so callers cannot mutate the cached entry
+        return dict(self._risk_cached(review_text, reviewer_key))
+
+    def _risk_from_key(
+        self, review_text: str, reviewer_key: FrozenArg
+    ) -> Dict[str, Any]:
+        return self._compute_risk_factors(review_text, reviewer_key.value)
+
+    def _compute_risk_factors(
+        self, review_text: str, reviewer_data: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Uncached risk factor breakdown behind get_risk_factors
+        """
         text_score = self._analyze_text_patterns(review_text)
         behavior_score = (
             self._analyze_reviewer_behavior(reviewer_data) if reviewer_data else 0.0
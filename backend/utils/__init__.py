@@ -2,9 +2,10 @@
 Utility functions and data processing tools.
 
 Contains helper functions for data processing, sample data generation,
-and statistical analysis.
+statistical analysis, and cache-key construction.
 """
 
+from .caching import FrozenArg, freeze
 from .data_processor import DataProcessor
 
-__all__ = ["DataProcessor"]
+__all__ = ["DataProcessor", "FrozenArg", "freeze"]
@@ -0,0 +1,116 @@
+"""
+Helpers for memoising service calls.
+
+Reviewer and location payloads arrive as nested dicts and lists, which cannot
+be used as ``functools.lru_cache`` keys directly. These helpers turn them into
+hashable snapshots the callee can rebuild its argument from, so cache keys
+never hold on to the caller's objects.
+"""
+
+import weakref
+from functools import lru_cache
+from typing import Any, Callable, Hashable
+
+# Tags marking which container a frozen snapshot was taken from
+_DICT, _LIST, _TUPLE, _SET, _FROZENSET = "dict", "list", "tuple", "set", "frozenset"
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Convert a nested structure of dicts, lists and sets into a hashable value.
+
+    Args:
+        value: Value to convert (typically reviewer or location data)
+
+    Returns:
+        Hashable snapshot of the value; containers become (tag, contents)
+        pairs, with dicts as frozensets of items so key order is ignored
+
+    Raises:
+        TypeError: If the value contains an object that cannot be hashed
+    """
+    if isinstance(value, dict):
+        return _DICT, frozenset((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return _LIST, tuple(freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return _TUPLE, tuple(freeze(item) for item in value)
+    if isinstance(value, set):
+        return _SET, frozenset(freeze(item) for item in value)
+    if isinstance(value, frozenset):
+        return _FROZENSET, frozenset(freeze(item) for item in value)
+    hash(value)
+    return value
+
+
+def thaw(frozen: Hashable) -> Any:
+    """
+    Rebuild a fresh copy of the structure a freeze snapshot was taken from.
+
+    Args:
+        frozen: Value returned by freeze
+
+    Returns:
+        New dicts, lists and sets equal to the original at freeze time
+    """
+    if not isinstance(frozen, tuple):
+        return frozen
+    tag, contents = frozen
+    if tag == _DICT:
+        return {key: thaw(item) for key, item in contents}
+    if tag == _LIST:
+        return [thaw(item) for item in contents]
+    if tag == _TUPLE:
+        return tuple(thaw(item) for item in contents)
+    if tag == _SET:
+        return {thaw(item) for item in contents}
+    return frozenset(thaw(item) for item in contents)
+
+
+class FrozenArg:
+    """
+    Hashable wrapper that lets an unhashable argument pass through lru_cache.
+
+    Only a frozen snapshot taken at construction is kept, so a cache entry
+    neither keeps the caller's object alive nor sees later mutations of it.
+    """
+
+    __slots__ = ("_key", "_hash")
+
+    def __init__(self, value: Any) -> None:
+        self._key = freeze(value)
+        self._hash = hash(self._key)
+
+    @property
+    def value(self) -> Any:
+        """Fresh copy of the wrapped value as it was at construction."""
+        return thaw(self._key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FrozenArg) and self._key == other._key
+
+
+def cached_method(method: Callable[..., Any], maxsize: int) -> Callable[..., Any]:
+    """
+    Build a per-instance lru_cache over a bound method.
+
+    The cache reaches the instance through a weak reference, so storing it on
+    the instance does not create a reference cycle.
+
+    Args:
+        method: Bound method to memoise; its arguments must be hashable
+        maxsize: Maximum number of cached results
+
+    Returns:
+        Memoised callable taking the same arguments as the method
+    """
+    weak_method = weakref.WeakMethod(method)
+
+    @lru_cache(maxsize=maxsize)
+    def cached(*args: Hashable) -> Any:
+        return weak_method()(*args)
+
+    return cached
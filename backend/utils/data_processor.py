@@ -1,15 +1,161 @@
+import json
+import math
 import numpy as np  # type: ignore
-import random
 from datetime import datetime, timedelta
+from itertools import compress
 from typing import Dict, List, Optional, Any
 
 
+def _json_safe(value: Any) -> Any:
+    """
+    Copy of value with NaN and infinities replaced by None.
+
+    Both encoders then write them as null; json would otherwise emit the
+    non-standard NaN token that strict parsers reject.
+    """
+    if isinstance(value, (float, np.floating)):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return _json_safe(value.tolist())
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    # NumPy scalars, which json cannot encode itself
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps_json(data: Any) -> bytes:
+    return json.dumps(_json_safe(data), default=_json_default, allow_nan=False).encode(
+        "utf-8"
+    )
+
+
+# Encode exports with orjson when it is installed, else the standard library
+try:  # pragma: no cover - import guard
+    import orjson  # type: ignore
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(_json_safe(data), option=orjson.OPT_SERIALIZE_NUMPY)
+
+except ImportError:  # pragma: no cover - import guard
+    orjson = None
+    _dumps = _dumps_json
+
+
+# Fixed pools the sample generators draw from
+_TRUSTED_TEXTS = (
+    "Excellent food quality and attentive service. The atmosphere was perfect for our date night. Highly recommend the seafood pasta!",
+    "Great value for money. Fresh ingredients and generous portions. Staff was friendly and accommodating.",
+    "Outstanding experience from start to finish. The chef clearly knows what they're doing. Will definitely return.",
+    "Perfect spot for lunch meetings. Quiet environment, professional service, and delicious food.",
+    "Family-friendly restaurant with something for everyone. Kids loved the pizza, adults enjoyed the wine selection.",
+)
+_FLAGGED_TEXTS = (
+    "Amazing amazing amazing! Best place ever! Perfect perfect perfect!",
+    "Terrible worst experience ever never going back horrible horrible",
+    "Good food nice place recommend",
+    "This place is absolutely amazing perfect excellent outstanding wonderful fantastic great",
+    "Worst service terrible food awful experience disgusting never again",
+)
+_FLAG_REASONS = (
+    "Repetitive language",
+    "Extreme sentiment",
+    "New account activity",
+    "Generic content",
+    "Suspicious timing",
+)
+_ACTIVITY_TYPES = (
+    "Posted review",
+    "Updated profile",
+    "Verified email",
+    "Added photo",
+    "Liked review",
+    "Reported review",
+)
+_TRUST_IMPACTS = ("positive", "neutral", "negative")
+_GOOD_REVIEW_TEXTS = (
+    "Really enjoyed our dinner here. The service was prompt and the food was delicious. Great atmosphere for a night out.",
+    "Solid restaurant with good food and reasonable prices. Staff was friendly and helpful.",
+    "Had a wonderful experience. The pasta was perfectly cooked and the wine selection was excellent.",
+    "Family-friendly place with great food. Kids menu had good options and adults enjoyed their meals too.",
+    "Beautiful restaurant with amazing views. Food quality matched the ambiance perfectly.",
+)
+_SUSPICIOUS_REVIEW_TEXTS = (
+    "Amazing amazing best place ever!!!",
+    "Terrible worst food ever never going back",
+    "Perfect excellent outstanding wonderful",
+    "Good food nice staff",
+    "Bad service awful experience horrible",
+)
+_CATEGORIES = ("Restaurant", "Cafe", "Fast Food", "Fine Dining")
+
+# Lower edges of the medium and high trust buckets in calculate_statistics
+_TRUST_BUCKET_EDGES = np.array([0.4, 0.7])
+
+
+def _bulk_date_strings(days_ago: np.ndarray, unit: str = "D") -> List[str]:
+    """
+    Format the moments a number of days before now in one vectorised pass.
+
+    Args:
+        days_ago: Integer array of day offsets into the past
+        unit: NumPy datetime unit; "D" gives YYYY-MM-DD dates and "us" gives
+            ISO 8601 timestamps
+
+    Returns:
+        List of formatted date strings, one per offset
+    """
+    now = np.datetime64(datetime.now(), unit)
+    return (now - days_ago.astype("timedelta64[D]")).astype(str).tolist()
+
+
+def _trust_walk(
+    variations: List[float], boosts: List[float], drifts: List[float]
+) -> List[float]:
+    """
+    Run the day-to-day trust score recurrence over pre-drawn randomness.
+
+    Each day's trust feeds the next, and clamping makes the walk non-linear,
+    so it cannot be vectorised; it runs as a plain loop over Python floats,
+    which is faster than indexing NumPy scalars for a month of data.
+
+    Args:
+        variations: Daily random variation applied to the base trust
+        boosts: Weekend boost for each day (0.0 on weekdays)
+        drifts: Random drift carried into the next day's base trust
+
+    Returns:
+        List of daily trust scores rounded to 3 decimal places
+    """
+    trust_scores: List[float] = []
+    base_trust = 0.7
+    for variation, boost, drift in zip(variations, boosts, drifts):
+        # Add some realistic variation, clamping after all adjustments
+        trust_score = max(0.0, min(1.0, base_trust + variation + boost))
+        trust_scores.append(round(trust_score, 3))
+
+        # Update base trust slightly for next day
+        base_trust = trust_score + drift
+
+    return trust_scores
+
+
 class DataProcessor:
     """
     Utility class for processing and generating sample data
     """
 
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        # Batched random draws for the sample generators; seed for repeatable data
+        self._rng = np.random.default_rng(seed)
+
         self.sample_locations = [
             "The Great Restaurant",
             "Amazing Cafe",
@@ -28,49 +174,63 @@ class DataProcessor:
             "Decent place for a quick bite. Fair prices and good portions.",
         ]
 
-    def generate_trend_data(self, days: int = 30) -> List[Dict[str, Any]]:
+    def generate_trend_data(
+        self, days: int = 30, keep_prob: float = 1.0
+    ) -> List[Dict[str, Any]]:
         """
         Generate sample trend data for trust scores over time.
 
         Args:
             days: Number of days to generate data for
+            keep_prob: Fraction of days to return, for long horizons where only
+                the overall shape is needed; kept days are evenly spread
 
         Returns:
             List of dictionaries containing trend data
+
+        Raises:
+            ValueError: If keep_prob is not in (0, 1]
         """
-        base_date = datetime.now() - timedelta(days=days)
-        trend_data: List[Dict[str, Any]] = []
-
-        base_trust = 0.7
-        for i in range(days):
-            # Add some realistic variation
-            daily_variation = random.uniform(-0.1, 0.1)
-            trust_score = base_trust + daily_variation
-
-            # Simulate weekend effects
-            current_date = base_date + timedelta(days=i)
-            if current_date.weekday() >= 5:  # Weekend
-                trust_score += 0.05
-
-            # Clamp after all adjustments
-            trust_score = max(0.0, min(1.0, trust_score))
-
-            trend_data.append(
-                {
-                    "date": current_date.strftime("%Y-%m-%d"),
-                    "trust_score": round(trust_score, 3),
-                    "review_count": random.randint(5, 25),
-                    # Ensure rating stays within [1.0, 5.0]
-                    "average_rating": max(
-                        1.0, min(5.0, round(random.uniform(3.5, 4.8), 1))
-                    ),
-                }
-            )
-
-            # Update base trust slightly for next day
-            base_trust = trust_score + random.uniform(-0.02, 0.02)
-
-        return trend_data
+        if not 0.0 < keep_prob <= 1.0:
+            raise ValueError("keep_prob must be in (0, 1]")
+
+        base_date = (datetime.now() - timedelta(days=days)).date()
+
+        # Draw every day's randomness up front in a few batched calls
+        rng = self._rng
+        daily_variations = rng.uniform(-0.1, 0.1, days)
+        drifts = rng.uniform(-0.02, 0.02, days)
+        review_counts = rng.integers(5, 26, days).tolist()
+        # Ensure rating stays within [1.0, 5.0]
+        average_ratings = np.clip(rng.uniform(3.5, 4.8, days).round(1), 1.0, 5.0)
+
+        day_offsets = np.arange(days)
+        dates = (np.datetime64(base_date, "D") + day_offsets).astype(str).tolist()
+        # Simulate weekend effects (weekday() 5 and 6 are Saturday and Sunday)
+        weekend_boosts = np.where(
+            (base_date.weekday() + day_offsets) % 7 >= 5, 0.05, 0.0
+        )
+
+        trust_scores = _trust_walk(
+            daily_variations.tolist(), weekend_boosts.tolist(), drifts.tolist()
+        )
+
+        rows = zip(dates, trust_scores, review_counts, average_ratings.tolist())
+        if keep_prob < 1.0:
+            # Keep a day each time the running total of keep_prob passes a
+            # whole number; deterministic, and only kept rows become dicts
+            kept = np.diff(np.floor(np.arange(days + 1) * keep_prob)) > 0
+            rows = compress(rows, kept.tolist())
+
+        return [
+            {
+                "date": date,
+                "trust_score": trust_score,
+                "review_count": review_count,
+                "average_rating": average_rating,
+            }
+            for date, trust_score, review_count, average_rating in rows
+        ]
 
     def get_sample_trusted_reviews(self, count: int = 5) -> List[Dict[str, Any]]:
         """
@@ -82,35 +242,31 @@ class DataProcessor:
         Returns:
             List of dictionaries containing trusted review data
         """
-        trusted_reviews: List[Dict[str, Any]] = []
-
-        for i in range(count):
-            review: Dict[str, Any] = {
+        # Draw every review's random fields up front in batched calls
+        rng = self._rng
+        text_indices = rng.integers(0, len(_TRUSTED_TEXTS), count).tolist()
+        trust_scores = rng.uniform(0.8, 0.95, count).round(3).tolist()
+        ratings = rng.integers(4, 6, count).tolist()
+        dates = _bulk_date_strings(rng.integers(1, 31, count))
+        review_counts = rng.integers(15, 101, count).tolist()
+        account_ages = rng.integers(200, 1001, count).tolist()
+
+        return [
+            {
                 "id": f"review_{i+1}",
-                "text": random.choice(
-                    [
-                        "Excellent food quality and attentive service. The atmosphere was perfect for our date night. Highly recommend the seafood pasta!",
-                        "Great value for money. Fresh ingredients and generous portions. Staff was friendly and accommodating.",
-                        "Outstanding experience from start to finish. The chef clearly knows what they're doing. Will definitely return.",
-                        "Perfect spot for lunch meetings. Quiet environment, professional service, and delicious food.",
-                        "Family-friendly restaurant with something for everyone. Kids loved the pizza, adults enjoyed the wine selection.",
-                    ]
-                ),
-                "trust_score": round(random.uniform(0.8, 0.95), 3),
-                "rating": random.randint(4, 5),
-                "date": (
-                    datetime.now() - timedelta(days=random.randint(1, 30))
-                ).strftime("%Y-%m-%d"),
+                "text": _TRUSTED_TEXTS[text_indices[i]],
+                "trust_score": trust_scores[i],
+                "rating": ratings[i],
+                "date": dates[i],
                 "reviewer": {
                     "name": f"TrustedUser{i+1}",
-                    "review_count": random.randint(15, 100),
-                    "account_age_days": random.randint(200, 1000),
+                    "review_count": review_counts[i],
+                    "account_age_days": account_ages[i],
                     "verified": True,
                 },
             }
-            trusted_reviews.append(review)
-
-        return trusted_reviews
+            for i in range(count)
+        ]
 
     def get_sample_flagged_reviews(self, count: int = 3) -> List[Dict[str, Any]]:
         """
@@ -122,46 +278,34 @@ class DataProcessor:
         Returns:
             List of dictionaries containing flagged review data
         """
-        flagged_reviews: List[Dict[str, Any]] = []
-
-        suspicious_texts = [
-            "Amazing amazing amazing! Best place ever! Perfect perfect perfect!",
-            "Terrible worst experience ever never going back horrible horrible",
-            "Good food nice place recommend",
-            "This place is absolutely amazing perfect excellent outstanding wonderful fantastic great",
-            "Worst service terrible food awful experience disgusting never again",
-        ]
-
-        for i in range(count):
-            review: Dict[str, Any] = {
+        # Draw every review's random fields up front in batched calls
+        rng = self._rng
+        text_indices = rng.integers(0, len(_FLAGGED_TEXTS), count).tolist()
+        trust_scores = rng.uniform(0.1, 0.3, count).round(3).tolist()
+        # Extreme ratings are suspicious
+        ratings = rng.choice([1, 5], count).tolist()
+        dates = _bulk_date_strings(rng.integers(1, 8, count))
+        review_counts = rng.integers(0, 6, count).tolist()
+        account_ages = rng.integers(1, 31, count).tolist()
+        flag_indices = rng.integers(0, len(_FLAG_REASONS), count).tolist()
+
+        return [
+            {
                 "id": f"flagged_{i+1}",
-                "text": random.choice(suspicious_texts),
-                "trust_score": round(random.uniform(0.1, 0.3), 3),
-                "rating": random.choice([1, 5]),  # Extreme ratings are suspicious
-                "date": (
-                    datetime.now() - timedelta(days=random.randint(1, 7))
-                ).strftime("%Y-%m-%d"),
+                "text": _FLAGGED_TEXTS[text_indices[i]],
+                "trust_score": trust_scores[i],
+                "rating": ratings[i],
+                "date": dates[i],
                 "reviewer": {
                     "name": f"SuspiciousUser{i+1}",
-                    "review_count": random.randint(0, 5),
-                    "account_age_days": random.randint(1, 30),
+                    "review_count": review_counts[i],
+                    "account_age_days": account_ages[i],
                     "verified": False,
                 },
-                "flags": [
-                    random.choice(
-                        [
-                            "Repetitive language",
-                            "Extreme sentiment",
-                            "New account activity",
-                            "Generic content",
-                            "Suspicious timing",
-                        ]
-                    )
-                ],
+                "flags": [_FLAG_REASONS[flag_indices[i]]],
             }
-            flagged_reviews.append(review)
-
-        return flagged_reviews
+            for i in range(count)
+        ]
 
     def get_sample_reviewer_activity(self, count: int = 10) -> List[Dict[str, Any]]:
         """
@@ -173,30 +317,25 @@ class DataProcessor:
         Returns:
             List of dictionaries containing activity data, sorted by date
         """
-        activities: List[Dict[str, Any]] = []
-
-        activity_types = [
-            "Posted review",
-            "Updated profile",
-            "Verified email",
-            "Added photo",
-            "Liked review",
-            "Reported review",
-        ]
-
-        for i in range(count):
-            activity: Dict[str, Any] = {
-                "date": (
-                    datetime.now() - timedelta(days=random.randint(1, 90))
-                ).strftime("%Y-%m-%d"),
-                "type": random.choice(activity_types),
-                "location": random.choice(self.sample_locations),
-                "trust_impact": random.choice(["positive", "neutral", "negative"]),
+        # Draw every activity's random fields up front in batched calls
+        rng = self._rng
+        # Fewest days ago first gives the newest-first order without a sort
+        # over the finished records
+        dates = _bulk_date_strings(np.sort(rng.integers(1, 91, count)))
+        type_indices = rng.integers(0, len(_ACTIVITY_TYPES), count).tolist()
+        location_indices = rng.integers(0, len(self.sample_locations), count).tolist()
+        impact_indices = rng.integers(0, len(_TRUST_IMPACTS), count).tolist()
+
+        return [
+            {
+                "date": dates[i],
+                "type": _ACTIVITY_TYPES[type_indices[i]],
+                "location": self.sample_locations[location_indices[i]],
+                "trust_impact": _TRUST_IMPACTS[impact_indices[i]],
                 "details": f"Activity {i+1} performed successfully",
             }
-            activities.append(activity)
-
-        return sorted(activities, key=lambda x: x["date"], reverse=True)
+            for i in range(count)
+        ]
 
     def generate_sample_reviews(self, count: int = 20) -> List[Dict[str, Any]]:
         """
@@ -208,61 +347,52 @@ class DataProcessor:
         Returns:
             List of dictionaries containing sample review data
         """
+        # Draw every review's random fields up front in batched calls
+        rng = self._rng
+        account_ages = rng.integers(1, 1001, count).tolist()
+        review_counts = rng.integers(0, 201, count).tolist()
+        profile_flags = rng.random((count, 3)) < 0.5
+        has_bio = (rng.random(count) > 0.5).tolist()
+        location_diversity = rng.uniform(0.1, 1.0, count).tolist()
+        # Generate review text with varying quality: 70% good, 30% suspicious
+        is_good = (rng.random(count) < 0.7).tolist()
+        text_draws = rng.random(count).tolist()
+        location_ids = rng.integers(1, 11, count).tolist()
+        location_indices = rng.integers(0, len(self.sample_locations), count).tolist()
+        category_indices = rng.integers(0, len(_CATEGORIES), count).tolist()
+        timestamps = _bulk_date_strings(rng.integers(1, 366, count), "us")
+        ratings = rng.integers(1, 6, count).tolist()
+
         reviews: List[Dict[str, Any]] = []
 
         for i in range(count):
-            # Generate realistic reviewer data
-            account_age = random.randint(1, 1000)
-            review_count = random.randint(0, 200)
+            photo, email, phone = profile_flags[i].tolist()
 
+            # Generate realistic reviewer data
             reviewer_data: Dict[str, Any] = {
                 "id": f"user_{i+1}",
-                "account_age_days": account_age,
-                "review_count": review_count,
-                "profile_photo": random.choice([True, False]),
-                "verified_email": random.choice([True, False]),
-                "verified_phone": random.choice([True, False]),
-                "bio": "Food enthusiast" if random.random() > 0.5 else "",
-                "location_diversity": random.uniform(0.1, 1.0),
+                "account_age_days": account_ages[i],
+                "review_count": review_counts[i],
+                "profile_photo": photo,
+                "verified_email": email,
+                "verified_phone": phone,
+                "bio": "Food enthusiast" if has_bio[i] else "",
+                "location_diversity": location_diversity[i],
                 "recent_reviews": [],
             }
 
-            # Generate review text with varying quality
-            if random.random() < 0.7:  # 70% good reviews
-                text = random.choice(
-                    [
-                        "Really enjoyed our dinner here. The service was prompt and the food was delicious. Great atmosphere for a night out.",
-                        "Solid restaurant with good food and reasonable prices. Staff was friendly and helpful.",
-                        "Had a wonderful experience. The pasta was perfectly cooked and the wine selection was excellent.",
-                        "Family-friendly place with great food. Kids menu had good options and adults enjoyed their meals too.",
-                        "Beautiful restaurant with amazing views. Food quality matched the ambiance perfectly.",
-                    ]
-                )
-            else:  # 30% suspicious reviews
-                text = random.choice(
-                    [
-                        "Amazing amazing best place ever!!!",
-                        "Terrible worst food ever never going back",
-                        "Perfect excellent outstanding wonderful",
-                        "Good food nice staff",
-                        "Bad service awful experience horrible",
-                    ]
-                )
+            texts = _GOOD_REVIEW_TEXTS if is_good[i] else _SUSPICIOUS_REVIEW_TEXTS
 
             review: Dict[str, Any] = {
-                "text": text,
+                "text": texts[int(text_draws[i] * len(texts))],
                 "reviewer_data": reviewer_data,
                 "location_data": {
-                    "id": f"location_{random.randint(1, 10)}",
-                    "name": random.choice(self.sample_locations),
-                    "category": random.choice(
-                        ["Restaurant", "Cafe", "Fast Food", "Fine Dining"]
-                    ),
+                    "id": f"location_{location_ids[i]}",
+                    "name": self.sample_locations[location_indices[i]],
+                    "category": _CATEGORIES[category_indices[i]],
                 },
-                "timestamp": (
-                    datetime.now() - timedelta(days=random.randint(1, 365))
-                ).isoformat(),
-                "rating": random.randint(1, 5),
+                "timestamp": timestamps[i],
+                "rating": ratings[i],
             }
 
             reviews.append(review)
@@ -284,29 +414,38 @@ class DataProcessor:
         if not reviews_data:
             return {}
 
-        trust_scores = [r.get("trust_score", 0.5) for r in reviews_data]
-        ratings = [r.get("rating", 3) for r in reviews_data]
+        review_count = len(reviews_data)
+        trust_scores = np.fromiter(
+            (r.get("trust_score", 0.5) for r in reviews_data),
+            dtype=np.float64,
+            count=review_count,
+        )
+        ratings = np.fromiter(
+            (r.get("rating", 3) for r in reviews_data),
+            dtype=np.float64,
+            count=review_count,
+        )
+
+        # Bucket 0 is below 0.4, 1 is [0.4, 0.7) and 2 is 0.7 and above;
+        # digitize puts NaN in the top bucket, so non-finite scores are dropped
+        finite_scores = trust_scores[np.isfinite(trust_scores)]
+        low_trust, medium_trust, high_trust = np.bincount(
+            np.digitize(finite_scores, _TRUST_BUCKET_EDGES), minlength=3
+        ).tolist()
 
         stats: Dict[str, Any] = {
-            "total_reviews": len(reviews_data),
-            "average_trust_score": (
-                round(float(np.mean(trust_scores)), 3) if trust_scores else 0.5
-            ),
-            "trust_score_std": (
-                round(float(np.std(trust_scores)), 3) if trust_scores else 0.0
-            ),
-            "average_rating": round(float(np.mean(ratings)), 2) if ratings else 3.0,
+            "total_reviews": review_count,
+            "average_trust_score": round(float(trust_scores.mean()), 3),
+            "trust_score_std": round(float(trust_scores.std()), 3),
+            "average_rating": round(float(ratings.mean()), 2),
             "trust_distribution": {
-                "high_trust": sum(1 for score in trust_scores if score >= 0.7),
-                "medium_trust": sum(1 for score in trust_scores if 0.4 <= score < 0.7),
-                "low_trust": sum(1 for score in trust_scores if score < 0.4),
+                "high_trust": high_trust,
+                "medium_trust": medium_trust,
+                "low_trust": low_trust,
             },
             "rating_distribution": {
-                "5_star": sum(1 for r in ratings if r == 5),
-                "4_star": sum(1 for r in ratings if r == 4),
-                "3_star": sum(1 for r in ratings if r == 3),
-                "2_star": sum(1 for r in ratings if r == 2),
-                "1_star": sum(1 for r in ratings if r == 1),
+                f"{stars}_star": int(np.count_nonzero(ratings == stars))
+                for stars in (5, 4, 3, 2, 1)
             },
         }
 
@@ -325,24 +464,29 @@ class DataProcessor:
         Returns:
             Dictionary containing formatted export data
         """
+        # One clock read so the default filename matches the export timestamp
+        now = datetime.now()
         if not filename:
-            filename = (
-                f"analysis_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            )
+            filename = f"analysis_results_{now.strftime('%Y%m%d_%H%M%S')}.json"
+
+        # Missing scores are NaN so they count as neither suspicious nor
+        # trusted, and as 0 towards the average
+        trust_scores = np.fromiter(
+            (r.get("trust_score", np.nan) for r in analysis_results),
+            dtype=np.float64,
+            count=len(analysis_results),
+        )
+        missing = np.isnan(trust_scores)
 
         export_data: Dict[str, Any] = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "summary": {
                 "total_analyzed": len(analysis_results),
                 "average_trust_score": float(
-                    np.mean([r.get("trust_score", 0) for r in analysis_results])
-                ),
-                "suspicious_count": sum(
-                    1 for r in analysis_results if r.get("trust_score", 1) < 0.3
-                ),
-                "trusted_count": sum(
-                    1 for r in analysis_results if r.get("trust_score", 0) > 0.7
+                    np.where(missing, 0.0, trust_scores).mean()
                 ),
+                "suspicious_count": int(np.count_nonzero(trust_scores < 0.3)),
+                "trusted_count": int(np.count_nonzero(trust_scores > 0.7)),
             },
             "detailed_results": analysis_results,
             "metadata": {
@@ -353,3 +497,18 @@ class DataProcessor:
         }
 
         return export_data
+
+    def export_analysis_results_bytes(
+        self, analysis_results: List[Dict[str, Any]], filename: Optional[str] = None
+    ) -> bytes:
+        """
+        Export analysis results as UTF-8 encoded JSON, ready to write to disk.
+
+        Args:
+            analysis_results: List of analysis result dictionaries
+            filename: Optional filename for the export
+
+        Returns:
+            JSON bytes of the export_analysis_results structure
+        """
+        return _dumps(self.export_analysis_results(analysis_results, filename))
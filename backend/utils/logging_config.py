@@ -4,11 +4,23 @@ Logging configuration for the Review Trust System.
 Sets up structured logging for monitoring application behaviour and debugging.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
+_APP_LOGGER = "review_trust_system"
+_CONSOLE_HANDLER = "review_trust_system.console"
+_FILE_HANDLER_PREFIX = "review_trust_system.file:"
+
+# The one log file currently attached: the queue handler on the app logger
+# and the listener thread writing its records to the file
+_active_file_handler: Optional[QueueHandler] = None
+_active_listener: Optional[QueueListener] = None
+
 
 def setup_logging(
     log_level: str = "INFO", log_file: Optional[str] = None
@@ -23,33 +35,75 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
+    global _active_file_handler, _active_listener
+
     # Create formatter
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    # Configure root logger
-    logger = logging.getLogger("review_trust_system")
-    logger.setLevel(getattr(logging, log_level.upper()))
+    # Configure root logger; unknown level names fall back to INFO
+    logger = logging.getLogger(_APP_LOGGER)
+    level = logging.getLevelName(log_level.upper())
+    logger.setLevel(level if isinstance(level, int) else logging.INFO)
+
+    # Handlers are named so repeated calls only attach what is missing;
+    # adding one twice would emit every record twice
+    attached = {handler.name for handler in logger.handlers}
 
     # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    if _CONSOLE_HANDLER not in attached:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.set_name(_CONSOLE_HANDLER)
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
 
-    # File handler (optional)
+    # File handler (optional); a new log file replaces the previous one
     if log_file:
         log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler_name = f"{_FILE_HANDLER_PREFIX}{log_path.resolve()}"
+        if file_handler_name not in attached:
+            stop_file_logging()
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setFormatter(formatter)
+
+            # File writes happen on a listener thread; logging calls only enqueue
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            listener = QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            listener.start()
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.set_name(file_handler_name)
+            logger.addHandler(queue_handler)
+            _active_file_handler, _active_listener = queue_handler, listener
 
     return logger
 
 
+def stop_file_logging() -> None:
+    """
+    Detach the active log file, writing out queued records and closing it.
+
+    Safe to call when no log file is attached. Runs at interpreter exit.
+    """
+    global _active_file_handler, _active_listener
+    if _active_listener is not None:
+        _active_listener.stop()  # Drains the queue before returning
+        for handler in _active_listener.handlers:
+            handler.close()
+    if _active_file_handler is not None:
+        logging.getLogger(_APP_LOGGER).removeHandler(_active_file_handler)
+    _active_file_handler = None
+    _active_listener = None
+
+
+atexit.register(stop_file_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -61,7 +115,3 @@ def get_logger(name: str) -> logging.Logger:
         Logger instance
     """
     return logging.getLogger(f"review_trust_system.{name}")
-
-
-# Create application logger
-app_logger = setup_logging()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import sys
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Union
 
 # Make eel optional so tests and CLI can run without it
@@ -11,13 +12,17 @@ except Exception:  # pragma: no cover - import guard
     _eel_available = False
 
     class _EelStub:
-        def expose(self, f: Any) -> Any:  # type: ignore[no-redef]
+        # Static so each @eel.expose is a plain call with no bound method
+        @staticmethod
+        def expose(f: Any) -> Any:  # type: ignore[no-redef]
             return f
 
-        def init(self, *_args: Any, **_kwargs: Any) -> None:  # type: ignore[no-redef]
+        @staticmethod
+        def init(*_args: Any, **_kwargs: Any) -> None:  # type: ignore[no-redef]
             return None
 
-        def start(self, *_args: Any, **_kwargs: Any) -> None:  # type: ignore[no-redef]
+        @staticmethod
+        def start(*_args: Any, **_kwargs: Any) -> None:  # type: ignore[no-redef]
             raise RuntimeError(
                 "Eel is not available. Install 'eel' to run the desktop app."
             )
@@ -29,16 +34,54 @@ from backend.services.trust_scorer import TrustScorer
 from backend.services.sentiment_analyser import SentimentAnalyser
 from backend.services.fake_detector import FakeReviewDetector
 from backend.utils.data_processor import DataProcessor
-from backend.utils.logging_config import get_logger
+from backend.utils.logging_config import get_logger, setup_logging
 
 logger = get_logger("main")
 
-# Initialise ML services
-review_analyser = ReviewAnalyser()
-trust_scorer = TrustScorer()
-sentiment_analyser = SentimentAnalyser()
-fake_detector = FakeReviewDetector()
-data_processor = DataProcessor()
+
+# ML services are built on first use so an endpoint only pays for the
+# services it actually calls
+@lru_cache(maxsize=1)
+def _review_analyser() -> ReviewAnalyser:
+    return ReviewAnalyser()
+
+
+@lru_cache(maxsize=1)
+def _trust_scorer() -> TrustScorer:
+    return TrustScorer()
+
+
+@lru_cache(maxsize=1)
+def _sentiment_analyser() -> SentimentAnalyser:
+    return SentimentAnalyser()
+
+
+@lru_cache(maxsize=1)
+def _fake_detector() -> FakeReviewDetector:
+    return FakeReviewDetector()
+
+
+@lru_cache(maxsize=1)
+def _data_processor() -> DataProcessor:
+    return DataProcessor()
+
+
+# The services used to be module-level instances; keep those names working
+# without building every service at import time
+_SERVICE_FACTORIES = {
+    "review_analyser": _review_analyser,
+    "trust_scorer": _trust_scorer,
+    "sentiment_analyser": _sentiment_analyser,
+    "fake_detector": _fake_detector,
+    "data_processor": _data_processor,
+}
+
+
+def __getattr__(name: str) -> Any:
+    factory = _SERVICE_FACTORIES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
 
 
 @eel.expose
@@ -51,69 +94,185 @@ def analyze_review(
     Main function to analyze a review's trustworthiness
     """
     try:
-        # Process the review through multiple ML models
-        sentiment_score = sentiment_analyser.analyse_sentiment(review_text)
-        authenticity_score = review_analyser.calculate_authenticity(
-            review_text, reviewer_data
-        )
-        fake_probability = fake_detector.detect_fake_review(review_text, reviewer_data)
-        trust_score = trust_scorer.calculate_trust_score(
-            review_text,
-            sentiment_score,
-            authenticity_score,
-            fake_probability,
-            reviewer_data,
-            location_data,
-        )
-
-        return {
-            "success": True,
-            "trust_score": trust_score,
-            "sentiment_score": sentiment_score,
-            "authenticity_score": authenticity_score,
-            "fake_probability": fake_probability,
-            "analysis": {
-                "sentiment": sentiment_analyser.get_sentiment_breakdown(review_text),
-                "authenticity_factors": review_analyser.get_authenticity_factors(
-                    review_text
-                ),
-                "risk_factors": fake_detector.get_risk_factors(
-                    review_text, reviewer_data
-                ),
-            },
-        }
+        # Repeats are served by the services' own memo tables
+        return _score_review(review_text, reviewer_data, location_data)
     except Exception as e:
         logger.exception("analyze_review failed")
         return {"success": False, "error": str(e)}
 
 
+def _score_review(
+    review_text: str,
+    reviewer_data: Optional[Dict[str, Any]],
+    location_data: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Run a review through every ML service; errors propagate to analyze_review
+    """
+    # Process the review through multiple ML models
+    sentiment_score = _sentiment_analyser().analyse_sentiment(review_text)
+    authenticity_score = _review_analyser().calculate_authenticity(
+        review_text, reviewer_data
+    )
+    fake_probability = _fake_detector().detect_fake_review(review_text, reviewer_data)
+    trust_score = _trust_scorer().calculate_trust_score(
+        review_text,
+        sentiment_score,
+        authenticity_score,
+        fake_probability,
+        reviewer_data,
+        location_data,
+    )
+
+    return _review_result(
+        review_text,
+        reviewer_data,
+        trust_score,
+        sentiment_score,
+        authenticity_score,
+        fake_probability,
+    )
+
+
+def _review_result(
+    review_text: str,
+    reviewer_data: Optional[Dict[str, Any]],
+    trust_score: float,
+    sentiment_score: Dict[str, Any],
+    authenticity_score: float,
+    fake_probability: float,
+) -> Dict[str, Any]:
+    """
+    Assemble the analyze_review response for one successfully scored review
+    """
+    return {
+        "success": True,
+        "trust_score": trust_score,
+        "sentiment_score": sentiment_score,
+        "authenticity_score": authenticity_score,
+        "fake_probability": fake_probability,
+        "analysis": {
+            "sentiment": _sentiment_analyser().get_sentiment_breakdown(review_text),
+            "authenticity_factors": _review_analyser().get_authenticity_factors(
+                review_text
+            ),
+            "risk_factors": _fake_detector().get_risk_factors(
+                review_text, reviewer_data
+            ),
+        },
+    }
+
+
+def _analyze_reviews_batch(reviews_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Score a batch of reviews, running each service stage over the whole batch
+
+    Expects reviews that pass _batchable; any failure is left to the caller.
+    """
+    review_texts = [review.get("text", "") for review in reviews_data]
+    reviewer_data_list = [review.get("reviewer_data") for review in reviews_data]
+    location_data_list = [review.get("location_data") for review in reviews_data]
+
+    sentiment_analyser = _sentiment_analyser()
+    sentiment_scores = [sentiment_analyser.analyse_sentiment(t) for t in review_texts]
+    authenticity_scores = _review_analyser().calculate_authenticity_batch(
+        review_texts, reviewer_data_list
+    )
+    fake_probabilities = _fake_detector().detect_fake_reviews(
+        review_texts, reviewer_data_list
+    )
+    trust_scores = _trust_scorer().calculate_trust_scores(
+        review_texts,
+        sentiment_scores,
+        authenticity_scores,
+        fake_probabilities,
+        reviewer_data_list,
+        location_data_list,
+    )
+
+    return [
+        _review_result(*fields)
+        for fields in zip(
+            review_texts,
+            reviewer_data_list,
+            trust_scores.tolist(),
+            sentiment_scores,
+            authenticity_scores.tolist(),
+            fake_probabilities.tolist(),
+        )
+    ]
+
+
+def _batchable(review: Any) -> bool:
+    """
+    Check a review has the field types the batch path expects
+    """
+    return (
+        isinstance(review, dict)
+        and isinstance(review.get("text", ""), str)
+        and isinstance(review.get("reviewer_data"), (dict, type(None)))
+        and isinstance(review.get("location_data"), (dict, type(None)))
+    )
+
+
+def _analyze_single(review: Dict[str, Any]) -> Dict[str, Any]:
+    return analyze_review(
+        review.get("text", ""),
+        review.get("reviewer_data"),
+        review.get("location_data"),
+    )
+
+
+def _analyze_reviews(reviews_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Analyse a list of reviews, batching the well-formed ones
+
+    Malformed reviews go through analyze_review on their own, so only they
+    fail and the rest of the batch is scored once.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(reviews_data)
+    batch_rows = [i for i, review in enumerate(reviews_data) if _batchable(review)]
+
+    if batch_rows:
+        try:
+            batch_results = _analyze_reviews_batch(
+                [reviews_data[i] for i in batch_rows]
+            )
+        except Exception:
+            logger.exception(
+                "Batch analysis failed, analysing %d reviews individually",
+                len(batch_rows),
+            )
+        else:
+            for i, result in zip(batch_rows, batch_results):
+                results[i] = result
+
+    return [
+        result if result is not None else _analyze_single(review)
+        for review, result in zip(reviews_data, results)
+    ]
+
+
 @eel.expose
 def analyze_bulk_reviews(reviews_data: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Analyze multiple reviews for a location
     """
     try:
-        results: List[Dict[str, Any]] = []
-        trust_trends: List[Dict[str, Any]] = []
-
-        for review in reviews_data:
-            result = analyze_review(
-                review.get("text", ""),
-                review.get("reviewer_data"),
-                review.get("location_data"),
-            )
-            results.append(result)
-            if result.get("success"):
-                trust_trends.append(
-                    {
-                        "timestamp": review.get("timestamp"),
-                        "trust_score": result["trust_score"],
-                    }
-                )
+        results = _analyze_reviews(reviews_data)
+
+        trust_trends: List[Dict[str, Any]] = [
+            {
+                "timestamp": review.get("timestamp"),
+                "trust_score": result["trust_score"],
+            }
+            for review, result in zip(reviews_data, results)
+            if result.get("success")
+        ]
 
         # Calculate location-level metrics
-        location_trust_score = trust_scorer.calculate_location_trust(results)
-        anomaly_detection = fake_detector.detect_temporal_anomalies(trust_trends)
+        location_trust_score = _trust_scorer().calculate_location_trust(results)
+        anomaly_detection = _fake_detector().detect_temporal_anomalies(trust_trends)
 
         return {
             "success": True,
@@ -154,14 +313,14 @@ def get_trust_dashboard_data(location_id: str) -> Dict[str, Any]:
                 "medium_trust": 28,
                 "low_trust": 10,
             },
-            "trend_data": data_processor.generate_trend_data(),
+            "trend_data": _data_processor().generate_trend_data(),
             "risk_factors": {
                 "fake_review_probability": 0.15,
                 "reviewer_network_anomalies": 2,
                 "temporal_anomalies": 1,
             },
-            "top_trusted_reviews": data_processor.get_sample_trusted_reviews(),
-            "flagged_reviews": data_processor.get_sample_flagged_reviews(),
+            "top_trusted_reviews": _data_processor().get_sample_trusted_reviews(),
+            "flagged_reviews": _data_processor().get_sample_flagged_reviews(),
         }
     except Exception as e:
         logger.exception("get_trust_dashboard_data failed")
@@ -217,7 +376,7 @@ def get_reviewer_trust_profile(reviewer_id: str) -> Dict[str, Any]:
                 "location_diversity": 0.85,
                 "network_analysis": "clean",
             },
-            "recent_activity": data_processor.get_sample_reviewer_activity(),
+            "recent_activity": _data_processor().get_sample_reviewer_activity(),
         }
     except Exception as e:
         logger.exception("get_reviewer_trust_profile failed")
@@ -228,6 +387,7 @@ def start_app() -> None:
     """
     Start the Eel application
     """
+    setup_logging()
     try:
         # Initialise web folder then start the web app
         eel.init("frontend/dist")
@@ -4,21 +4,33 @@ Unit tests for the FakeReviewDetector service.
 
 import unittest
 
+import numpy as np
+
 from tests.test_config import (
     SAMPLE_REVIEWS,
     SAMPLE_REVIEWER_DATA,
+    UnitFloatAssertions,
     get_sample_trust_trends,
 )
 from backend.services.fake_detector import FakeReviewDetector
 
+# Read-only trend fixtures, generated once for the module
+_TREND_30 = tuple(get_sample_trust_trends(30))
+_TREND_5 = tuple(get_sample_trust_trends(5))  # Less than minimum required
+
 
-class TestFakeReviewDetector(unittest.TestCase):
+class TestFakeReviewDetector(UnitFloatAssertions, unittest.TestCase):
     """Test cases for the FakeReviewDetector class."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.detector = FakeReviewDetector()
-        self.sample_review = SAMPLE_REVIEWS["positive"]
+    EXPECTED_RISK_KEYS = frozenset(
+        {"text_suspicion", "behavior_suspicion", "network_suspicion", "overall_risk"}
+    )
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up test fixtures shared by every test in the class."""
+        cls.detector = FakeReviewDetector()
+        cls.sample_review = SAMPLE_REVIEWS["positive"]
 
     def test_initialisation(self) -> None:
         """Test that FakeReviewDetector initialises correctly."""
@@ -32,26 +44,20 @@ class TestFakeReviewDetector(unittest.TestCase):
         """Test fake review detection with normal text."""
         result = self.detector.detect_fake_review(self.sample_review)
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+        self.assertUnitFloat(result)
 
     def test_detect_fake_review_with_reviewer_data(self) -> None:
         """Test fake review detection with reviewer data."""
         trusted_data = SAMPLE_REVIEWER_DATA["trusted"]
         result = self.detector.detect_fake_review(self.sample_review, trusted_data)
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+        self.assertUnitFloat(result)
 
     def test_detect_fake_review_suspicious_text(self) -> None:
         """Test fake review detection with suspicious text."""
         result = self.detector.detect_fake_review(SAMPLE_REVIEWS["suspicious"])
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+        self.assertUnitFloat(result)
         # Suspicious text should have higher fake probability
         self.assertGreater(result, 0.3)
 
@@ -59,9 +65,7 @@ class TestFakeReviewDetector(unittest.TestCase):
         """Test fake review detection with fake positive text."""
         result = self.detector.detect_fake_review(SAMPLE_REVIEWS["fake_positive"])
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+        self.assertUnitFloat(result)
         # Fake text should have higher fake probability
         self.assertGreater(result, 0.2)
 
@@ -69,9 +73,18 @@ class TestFakeReviewDetector(unittest.TestCase):
         """Test fake review detection with empty string."""
         result = self.detector.detect_fake_review("")
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+        self.assertUnitFloat(result)
+
+    def test_detect_fake_review_whitespace_only(self) -> None:
+        """Test that whitespace-only text is scored like empty text."""
+        for text in ["   ", "\n", "\t \n"]:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    self.detector.detect_fake_review(text),
+                    self.detector.detect_fake_review(""),
+                )
+                self.assertEqual(len(self.detector.detect_fake_reviews([text])), 1)
+                self.assertIn("overall_risk", self.detector.get_risk_factors(text))
 
     def test_trusted_vs_suspicious_reviewer(self) -> None:
         """Test that trusted reviewers get lower fake probability."""
@@ -89,8 +102,7 @@ class TestFakeReviewDetector(unittest.TestCase):
 
     def test_detect_temporal_anomalies(self) -> None:
         """Test temporal anomaly detection."""
-        trust_trends = get_sample_trust_trends(30)
-        result = self.detector.detect_temporal_anomalies(trust_trends)
+        result = self.detector.detect_temporal_anomalies(list(_TREND_30))
 
         self.assertIsInstance(result, list)
         for anomaly in result:
@@ -98,10 +110,44 @@ class TestFakeReviewDetector(unittest.TestCase):
             self.assertIn("timestamp", anomaly)
             self.assertIn("anomaly_type", anomaly)
 
+    def test_detect_temporal_anomalies_score_outlier(self) -> None:
+        """Test that a single extreme trust score is flagged as an outlier."""
+        trust_trends = [
+            {"timestamp": f"2025-08-{day:02d}T12:00:00", "trust_score": 0.7}
+            for day in range(1, 20)
+        ]
+        trust_trends[10]["trust_score"] = 0.05
+
+        result = self.detector.detect_temporal_anomalies(trust_trends)
+        outliers = [a for a in result if a["anomaly_type"] == "score_outlier"]
+
+        self.assertEqual(len(outliers), 1)
+        self.assertEqual(outliers[0]["timestamp"], "2025-08-11T12:00:00")
+        self.assertAlmostEqual(outliers[0]["trust_score"], 0.05)
+        self.assertLessEqual(outliers[0]["severity"], 1.0)
+
+    def test_detect_temporal_anomalies_review_bombing(self) -> None:
+        """Test that a burst of reviews on one day is flagged as bombing."""
+        trust_trends = [
+            {"timestamp": f"2025-08-{day:02d} 12:00:00", "trust_score": 0.7}
+            for day in range(1, 11)
+        ]
+        trust_trends += [
+            {"timestamp": f"2025-08-20T{hour:02d}:00:00", "trust_score": 0.2}
+            for hour in range(20)
+        ]
+
+        result = self.detector.detect_temporal_anomalies(trust_trends)
+        bombing = [a for a in result if a["anomaly_type"] == "review_bombing"]
+
+        self.assertEqual(len(bombing), 1)
+        self.assertEqual(bombing[0]["timestamp"], "2025-08-20")
+        self.assertEqual(bombing[0]["review_count"], 20)
+        self.assertAlmostEqual(bombing[0]["trust_score"], 0.2)
+
     def test_detect_temporal_anomalies_insufficient_data(self) -> None:
         """Test temporal anomaly detection with insufficient data."""
-        trust_trends = get_sample_trust_trends(5)  # Less than minimum required
-        result = self.detector.detect_temporal_anomalies(trust_trends)
+        result = self.detector.detect_temporal_anomalies(list(_TREND_5))
 
         self.assertIsInstance(result, list)
         self.assertEqual(len(result), 0)
@@ -111,10 +157,7 @@ class TestFakeReviewDetector(unittest.TestCase):
         result = self.detector.get_risk_factors(self.sample_review)
 
         self.assertIsInstance(result, dict)
-        self.assertIn("text_suspicion", result)
-        self.assertIn("behavior_suspicion", result)
-        self.assertIn("network_suspicion", result)
-        self.assertIn("overall_risk", result)
+        self.assertLessEqual(self.EXPECTED_RISK_KEYS, result.keys())
 
         for factor in result.values():
             if isinstance(factor, (int, float)):
@@ -140,6 +183,42 @@ class TestFakeReviewDetector(unittest.TestCase):
         # Results should be identical for same input
         self.assertEqual(result1, result2)
 
+    def test_repeat_detection_uses_cache(self) -> None:
+        """Test that repeated detections with equal inputs hit the cache."""
+        detector = FakeReviewDetector()
+        reviewer_data = dict(SAMPLE_REVIEWER_DATA["trusted"])
+        detector.detect_fake_review(self.sample_review, reviewer_data)
+        detector.detect_fake_review(self.sample_review, dict(reviewer_data))
+
+        # Using # type: ignore to suppress protected member warnings for testing
+        info = detector._detect_cached.cache_info()  # type: ignore
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_detect_fake_reviews_batch(self) -> None:
+        """Test that batch detection matches one-at-a-time detection."""
+        texts = [SAMPLE_REVIEWS["positive"], SAMPLE_REVIEWS["suspicious"], ""]
+        reviewer_data = [SAMPLE_REVIEWER_DATA["trusted"], None, None]
+
+        result = self.detector.detect_fake_reviews(texts, reviewer_data)
+
+        self.assertEqual(len(result), 3)
+        for text, data, score in zip(texts, reviewer_data, result):
+            self.assertEqual(score, self.detector.detect_fake_review(text, data))
+
+    def test_detect_fake_reviews_mismatched_lengths(self) -> None:
+        """Test that batch detection rejects misaligned reviewer data."""
+        with self.assertRaises(ValueError):
+            self.detector.detect_fake_reviews([self.sample_review], [None, None])
+
+    def test_cached_risk_factors_are_copies(self) -> None:
+        """Test that mutating returned risk factors does not affect the cache."""
+        first = self.detector.get_risk_factors(self.sample_review)
+        first["overall_risk"] = -1.0
+        second = self.detector.get_risk_factors(self.sample_review)
+
+        self.assertGreaterEqual(second["overall_risk"], 0.0)
+
     def test_different_texts_different_scores(self) -> None:
         """Test that different texts produce different fake scores."""
         normal_score = self.detector.detect_fake_review(SAMPLE_REVIEWS["positive"])
@@ -153,40 +232,125 @@ class TestFakeReviewDetector(unittest.TestCase):
 
     def test_error_handling_none_input(self) -> None:
         """Test error handling with None input."""
-        with self.assertRaises(Exception):
+        with self.assertRaises(TypeError):
             self.detector.detect_fake_review(None)  # type: ignore
 
     def test_error_handling_non_string_input(self) -> None:
         """Test error handling with non-string input."""
-        with self.assertRaises(Exception):
+        with self.assertRaises(TypeError):
             self.detector.detect_fake_review(123)  # type: ignore
 
+    def test_get_risk_factors_non_string_input(self) -> None:
+        """Test that risk factors reject non-string text like detect_fake_review."""
+        for text in (None, 123):
+            with self.subTest(text=text):
+                with self.assertRaises(TypeError):
+                    self.detector.get_risk_factors(text)  # type: ignore
+
+    def test_error_handling_non_dict_reviewer_data(self) -> None:
+        """Test that reviewer data must be a dict when provided."""
+        with self.assertRaises(TypeError):
+            self.detector.detect_fake_review(self.sample_review, ["not", "a", "dict"])  # type: ignore
+
+    def test_detect_temporal_anomalies_missing_keys(self) -> None:
+        """Test that trends without trust scores yield no anomalies."""
+        trust_trends = [dict(trend) for trend in _TREND_30]
+        del trust_trends[5]["trust_score"]
+
+        self.assertEqual(self.detector.detect_temporal_anomalies(trust_trends), [])
+
+    def test_detect_temporal_anomalies_invalid_score(self) -> None:
+        """Test that a trend with a None trust score yields no anomalies."""
+        trust_trends = [dict(trend) for trend in _TREND_30]
+        trust_trends[5]["trust_score"] = None
+
+        self.assertEqual(self.detector.detect_temporal_anomalies(trust_trends), [])
+
+    def test_detect_temporal_anomalies_missing_timestamp(self) -> None:
+        """Test that undated trends still take part in outlier detection."""
+        trust_trends = [
+            {"timestamp": f"2025-08-{day:02d}T12:00:00", "trust_score": 0.7}
+            for day in range(1, 21)
+        ]
+        trust_trends[10]["trust_score"] = 0.0
+        trust_trends[3]["timestamp"] = None
+
+        result = self.detector.detect_temporal_anomalies(trust_trends)
+
+        self.assertEqual([a["anomaly_type"] for a in result], ["score_outlier"])
+        self.assertEqual(result[0]["timestamp"], "2025-08-11T12:00:00")
+
+    def test_detect_temporal_anomalies_numpy_scores(self) -> None:
+        """Test that NumPy scalar scores are accepted."""
+        trust_trends = [
+            {"timestamp": f"2025-08-{day:02d}T12:00:00", "trust_score": np.float32(0.7)}
+            for day in range(1, 21)
+        ]
+        trust_trends[10]["trust_score"] = np.float32(0.0)
+
+        result = self.detector.detect_temporal_anomalies(trust_trends)
+
+        self.assertEqual(len(result), 1)
+        self.assertAlmostEqual(result[0]["trust_score"], 0.0)
+
     def test_text_pattern_analysis(self) -> None:
         """Test text pattern analysis (protected method)."""
         # Using # type: ignore to suppress protected method warnings for testing
         result = self.detector._analyze_text_patterns(self.sample_review)  # type: ignore
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+        self.assertUnitFloat(result)
+
+    def test_text_pattern_analysis_counts_each_suspicious_pattern(self) -> None:
+        """Test that overlapping suspicious patterns are each counted."""
+        one_pattern = "We had dinner here and it was a five star meal overall."
+        all_patterns = (
+            "Order the steak, my friends recommend it, five star, a must try place."
+        )
+
+        # Using # type: ignore to suppress protected method warnings for testing
+        single = self.detector._analyze_text_patterns(one_pattern)  # type: ignore
+        multiple = self.detector._analyze_text_patterns(all_patterns)  # type: ignore
+
+        self.assertAlmostEqual(multiple - single, 0.6)
+
+    def test_repeated_words_non_ascii(self) -> None:
+        """Test that repeated accented or non-Latin words are detected."""
+        for text in ["café café", "très très bon", "очень очень вкусно"]:
+            with self.subTest(text=text):
+                # Using # type: ignore to suppress protected member warnings for testing
+                self.assertIsNotNone(self.detector._repeat_word_re.search(text))  # type: ignore
+                self.assertTrue(
+                    any(pat.search(text) for pat in self.detector._bot_res)  # type: ignore
+                )
 
     def test_reviewer_behavior_analysis(self) -> None:
         """Test reviewer behavior analysis (protected method)."""
         # Using # type: ignore to suppress protected method warnings for testing
         result = self.detector._analyze_reviewer_behavior(SAMPLE_REVIEWER_DATA["trusted"])  # type: ignore
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+        self.assertUnitFloat(result)
+
+    def test_count_same_day_reviews(self) -> None:
+        """Test counting of the busiest posting day (protected method)."""
+        reviews = [
+            {"date": "2025-08-01 09:00"},
+            {"date": "2025-08-01 12:30"},
+            {"date": "2025-08-01"},
+            {"date": "2025-08-02 10:00"},
+            {"date": ""},
+            {},
+        ]
+
+        # Using # type: ignore to suppress protected method warnings for testing
+        self.assertEqual(self.detector._count_same_day_reviews(reviews), 3)  # type: ignore
+        self.assertEqual(self.detector._count_same_day_reviews([]), 0)  # type: ignore
 
     def test_network_analysis(self) -> None:
         """Test network analysis (protected method)."""
         # Using # type: ignore to suppress protected method warnings for testing
         result = self.detector._simple_network_analysis(SAMPLE_REVIEWER_DATA["trusted"])  # type: ignore
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+        self.assertUnitFloat(result)
 
 
 if __name__ == "__main__":
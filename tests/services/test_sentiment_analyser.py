@@ -3,18 +3,30 @@ Unit tests for the SentimentAnalyser service.
 """
 
 import unittest
+from unittest.mock import patch
 
-from tests.test_config import SAMPLE_REVIEWS
-from backend.services.sentiment_analyser import SentimentAnalyser
+from textblob import TextBlob  # type: ignore
 
+from tests.test_config import SAMPLE_REVIEWS, UnitFloatAssertions
+from backend.services.sentiment_analyser import (
+    SentimentAnalyser,
+    _count_upper,
+    _word_polarity,
+)
 
-class TestSentimentAnalyser(unittest.TestCase):
+
+class TestSentimentAnalyser(UnitFloatAssertions, unittest.TestCase):
     """Test cases for the SentimentAnalyser class."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.analyser = SentimentAnalyser()
-        self.sample_review = SAMPLE_REVIEWS["positive"]
+    EXPECTED_SENTIMENT_KEYS = frozenset(
+        {"polarity", "subjectivity", "confidence", "intensity", "manipulation_score"}
+    )
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up test fixtures shared by every test in the class."""
+        cls.analyser = SentimentAnalyser()
+        cls.sample_review = SAMPLE_REVIEWS["positive"]
 
     def test_initialisation(self) -> None:
         """Test that SentimentAnalyser initialises correctly."""
@@ -29,11 +41,7 @@ class TestSentimentAnalyser(unittest.TestCase):
         result = self.analyser.analyse_sentiment(SAMPLE_REVIEWS["positive"])
 
         self.assertIsInstance(result, dict)
-        self.assertIn("polarity", result)
-        self.assertIn("subjectivity", result)
-        self.assertIn("confidence", result)
-        self.assertIn("intensity", result)
-        self.assertIn("manipulation_score", result)
+        self.assertLessEqual(self.EXPECTED_SENTIMENT_KEYS, result.keys())
 
         # Check that polarity is positive
         self.assertGreater(result["polarity"], 0.0)
@@ -115,9 +123,7 @@ class TestSentimentAnalyser(unittest.TestCase):
         # Using # type: ignore to suppress protected method warnings for testing
         result = self.analyser._calculate_sentiment_intensity(strong_sentiment)  # type: ignore
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+        self.assertUnitFloat(result)
 
     def test_calculate_sentiment_intensity_weak(self) -> None:
         """Test sentiment intensity calculation with weak sentiment."""
@@ -125,18 +131,14 @@ class TestSentimentAnalyser(unittest.TestCase):
         # Using # type: ignore to suppress protected method warnings for testing
         result = self.analyser._calculate_sentiment_intensity(weak_sentiment)  # type: ignore
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+        self.assertUnitFloat(result)
 
     def test_detect_sentiment_manipulation_normal_text(self) -> None:
         """Test sentiment manipulation detection with normal text."""
         # Using # type: ignore to suppress protected method warnings for testing
         result = self.analyser._detect_sentiment_manipulation(self.sample_review)  # type: ignore
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+        self.assertUnitFloat(result)
 
     def test_detect_sentiment_manipulation_manipulated_text(self) -> None:
         """Test sentiment manipulation detection with manipulated text."""
@@ -146,12 +148,60 @@ class TestSentimentAnalyser(unittest.TestCase):
         # Using # type: ignore to suppress protected method warnings for testing
         result = self.analyser._detect_sentiment_manipulation(manipulated_text)  # type: ignore
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+        self.assertUnitFloat(result)
         # Should detect manipulation
         self.assertGreater(result, 0.2)
 
+    def test_word_polarity_matches_textblob(self) -> None:
+        """Test that memoised word polarity matches a per-word TextBlob."""
+        for word in ["amazing", "terrible", "Great", "table", ":)"]:
+            expected = TextBlob(word).sentiment.polarity  # type: ignore
+            self.assertEqual(_word_polarity(word), expected)
+
+    def test_count_upper(self) -> None:
+        """Test uppercase counting for ASCII and non-ASCII text."""
+        for text in ["", "GREAT food!", "Crème BRÛLÉE", "ΑΒγ"]:
+            expected = sum(1 for c in text if c.isupper())
+            self.assertEqual(_count_upper(text), expected)
+
+    def test_repeat_analysis_uses_cache(self) -> None:
+        """Test that repeated analyses hit the cache and return copies."""
+        with patch.object(
+            SentimentAnalyser, "_detect_sentiment_manipulation", return_value=0.0
+        ):
+            analyser = SentimentAnalyser()
+            first = analyser.analyse_sentiment(self.sample_review)
+            first["polarity"] = 99.0
+            second = analyser.analyse_sentiment(self.sample_review)
+
+        # Using # type: ignore to suppress protected member warnings for testing
+        info = analyser._analyse_cached.cache_info()  # type: ignore
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+        self.assertNotEqual(second["polarity"], 99.0)
+
+    def test_analyse_sentiments_batch(self) -> None:
+        """Test that batch analysis matches one-at-a-time analysis."""
+        texts = [SAMPLE_REVIEWS["positive"], SAMPLE_REVIEWS["negative"], ""]
+        result = self.analyser.analyse_sentiments_batch(texts)
+
+        for i, text in enumerate(texts):
+            single = self.analyser.analyse_sentiment(text)
+            for key, value in single.items():
+                self.assertEqual(result[key][i], value)
+
+    def test_sentiment_breakdown_reuses_analysis(self) -> None:
+        """Test that the breakdown does not rescore manipulation."""
+        with patch.object(
+            SentimentAnalyser, "_detect_sentiment_manipulation", return_value=0.4
+        ) as manipulation:
+            analyser = SentimentAnalyser()
+            result = analyser.get_sentiment_breakdown(self.sample_review)
+
+        self.assertEqual(manipulation.call_count, 1)
+        self.assertAlmostEqual(result["manipulation_indicators"], 0.4)
+        self.assertAlmostEqual(result["authenticity_score"], 0.6)
+
     def test_multiple_analyses_consistency(self) -> None:
         """Test that multiple analyses on same text are consistent."""
         result1 = self.analyser.analyse_sentiment(self.sample_review)
@@ -188,12 +238,12 @@ class TestSentimentAnalyser(unittest.TestCase):
     def test_error_handling(self) -> None:
         """Test error handling with invalid inputs."""
         # Should handle error gracefully
-        with self.assertRaises(Exception):
+        with self.assertRaises(TypeError):
             self.analyser.analyse_sentiment(None)  # type: ignore
 
     def test_analyse_sentiment_non_string_input(self) -> None:
         """Test sentiment analysis with non-string input."""
-        with self.assertRaises(Exception):
+        with self.assertRaises(TypeError):
             self.analyser.analyse_sentiment(123)  # type: ignore
 
 
@@ -2,8 +2,12 @@
 Tests for backend.services exports and compatibility aliases.
 """
 
+import subprocess
+import sys
 import unittest
 
+from tests.test_config import PROJECT_ROOT
+
 
 class TestServicesExports(unittest.TestCase):
     def test_exports_british_and_american_aliases(self) -> None:
@@ -40,3 +44,18 @@ class TestServicesExports(unittest.TestCase):
         self.assertIsNotNone(SentimentAnalyzer())
         self.assertIsNotNone(FakeReviewDetector())
         self.assertIsNotNone(TrustScorer())
+
+    def test_submodule_import_does_not_load_other_services(self) -> None:
+        code = (
+            "import sys\n"
+            "import backend.services.trust_scorer\n"
+            "print('backend.services.review_analyser' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=PROJECT_ROOT,
+        )
+        self.assertEqual(result.stdout.strip(), "False")
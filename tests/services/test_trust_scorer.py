@@ -11,11 +11,14 @@ from backend.services.trust_scorer import TrustScorer
 class TestTrustScorer(unittest.TestCase):
     """Test cases for the TrustScorer class."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.scorer = TrustScorer()
-        self.sample_review = SAMPLE_REVIEWS["positive"]
-        self.sample_sentiment = {
+    EXPECTED_CONSISTENCY_SCORE = 0.88
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up test fixtures shared by every test in the class."""
+        cls.scorer = TrustScorer()
+        cls.sample_review = SAMPLE_REVIEWS["positive"]
+        cls.sample_sentiment = {
             "polarity": 0.5,
             "subjectivity": 0.6,
             "confidence": 0.8,
@@ -29,47 +32,127 @@ class TestTrustScorer(unittest.TestCase):
         self.assertIn("sentiment_quality", self.scorer.weights)
         self.assertIn("reviewer_credibility", self.scorer.weights)
 
-    def test_calculate_trust_score_basic(self) -> None:
-        """Test basic trust score calculation."""
-        result = self.scorer.calculate_trust_score(
-            self.sample_review,
-            self.sample_sentiment,
-            0.8,  # authenticity_score
-            0.2,  # fake_probability
+    def test_combine_trust_factors(self) -> None:
+        """Test that batched weighting matches the per-factor weighted sum."""
+        rows = [[0.9, 0.8, 0.7, 0.6, 0.5], [0.1, 0.2, 0.3, 0.4, 0.5]]
+        result = self.scorer.combine_trust_factors(rows)
+
+        self.assertEqual(result.shape, (2,))
+        for row, score in zip(rows, result):
+            expected = sum(
+                value * self.scorer.weights[key]
+                for key, value in zip(self.scorer.weight_keys, row)
+            )
+            self.assertAlmostEqual(score, expected)
+
+    def test_combine_trust_factors_wrong_shape(self) -> None:
+        """Test that a feature matrix with the wrong width is rejected."""
+        with self.assertRaises(ValueError):
+            self.scorer.combine_trust_factors([[0.5, 0.5]])
+
+    def test_calculate_trust_scores_batch(self) -> None:
+        """Test batch scoring, including the penalty for likely fakes."""
+        result = self.scorer.calculate_trust_scores_batch(
+            base_authenticity=[0.8, 0.8],
+            sentiment_quality=[0.7, 0.7],
+            reviewer_credibility=[0.6, 0.6],
+            content_quality=[0.9, 0.9],
+            temporal_consistency=[1.0, 1.0],
+            fake_probability=[0.2, 0.9],
         )
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
-
-    def test_calculate_trust_score_with_reviewer_data(self) -> None:
-        """Test trust score calculation with reviewer data."""
-        result = self.scorer.calculate_trust_score(
-            self.sample_review,
-            self.sample_sentiment,
-            0.8,
-            0.2,
-            SAMPLE_REVIEWER_DATA["trusted"],
+        weights = self.scorer.weights
+        expected = (
+            0.8 * weights["authenticity"]
+            + 0.7 * weights["sentiment_quality"]
+            + 0.6 * weights["reviewer_credibility"]
+            + 0.9 * weights["content_quality"]
+            + 1.0 * weights["temporal_consistency"]
         )
+        self.assertAlmostEqual(result[0], expected)
+        self.assertLess(result[1], result[0] / 2)
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+    def test_changed_weights_apply_to_batch_scoring(self) -> None:
+        """Test that edited weights are used by both single and batch scoring."""
+        scorer = TrustScorer()
+        scorer.weights["content_quality"] = 0.5
+        scorer.weights["authenticity"] = 0.0
 
-    def test_calculate_trust_score_with_location_data(self) -> None:
-        """Test trust score calculation with location data."""
-        result = self.scorer.calculate_trust_score(
-            self.sample_review,
-            self.sample_sentiment,
-            0.8,
-            0.2,
-            SAMPLE_REVIEWER_DATA["trusted"],
-            SAMPLE_LOCATION_DATA["restaurant"],
+        single = scorer.calculate_trust_score(
+            self.sample_review, self.sample_sentiment, 0.8, 0.2
+        )
+        batch = scorer.calculate_trust_scores(
+            [self.sample_review], [self.sample_sentiment], [0.8], [0.2], [None], [None]
         )
 
-        self.assertIsInstance(result, float)
-        self.assertGreaterEqual(result, 0.0)
-        self.assertLessEqual(result, 1.0)
+        self.assertAlmostEqual(batch[0], single)
+        self.assertNotAlmostEqual(single, self.EXPECTED_CONSISTENCY_SCORE)
+
+    def test_calculate_trust_scores_matches_single(self) -> None:
+        """Test that batch scoring from raw inputs matches per-review scoring."""
+        restaurant = SAMPLE_LOCATION_DATA["restaurant"]
+        clustered = dict(
+            SAMPLE_REVIEWER_DATA["moderate"],
+            recent_reviews=[
+                {"timestamp": f"2025-08-01T{hour:02d}:00:00"} for hour in range(6)
+            ],
+        )
+        reviews = [
+            (self.sample_review, SAMPLE_REVIEWER_DATA["trusted"], restaurant),
+            (self.sample_review, SAMPLE_REVIEWER_DATA["suspicious"], restaurant),
+            (SAMPLE_REVIEWS["neutral"], clustered, None),
+            (SAMPLE_REVIEWS["negative"], None, None),
+        ]
+        authenticity = [0.8, 0.8, 0.6, 0.4]
+        fake = [0.2, 0.2, 0.5, 0.9]
+        result = self.scorer.calculate_trust_scores(
+            [text for text, _, _ in reviews],
+            [self.sample_sentiment] * len(reviews),
+            authenticity,
+            fake,
+            [reviewer for _, reviewer, _ in reviews],
+            [location for _, _, location in reviews],
+        )
+
+        for (text, reviewer, location), auth, fake_prob, score in zip(
+            reviews, authenticity, fake, result
+        ):
+            expected = self.scorer.calculate_trust_score(
+                text, self.sample_sentiment, auth, fake_prob, reviewer, location
+            )
+            self.assertAlmostEqual(score, expected)
+
+        # Reviewer factors must actually differ between the profiles
+        self.assertGreater(result[0], result[1])
+
+    def test_calculate_trust_score_bounds(self) -> None:
+        """Test that trust scores are floats within bounds across inputs."""
+        extreme_high = {"polarity": 1.0, "subjectivity": 0.0, "confidence": 1.0}
+        extreme_low = {"polarity": -1.0, "subjectivity": 1.0, "confidence": 0.0}
+        trusted = SAMPLE_REVIEWER_DATA["trusted"]
+        restaurant = SAMPLE_LOCATION_DATA["restaurant"]
+        cases = [
+            ("basic", self.sample_sentiment, 0.8, 0.2, None, None),
+            ("with_reviewer", self.sample_sentiment, 0.8, 0.2, trusted, None),
+            ("with_location", self.sample_sentiment, 0.8, 0.2, trusted, restaurant),
+            ("extreme_high", extreme_high, 1.0, 0.0, None, None),
+            ("extreme_low", extreme_low, 0.0, 1.0, None, None),
+        ]
+
+        for name, sentiment, authenticity, fake, reviewer, location in cases:
+            with self.subTest(name):
+                result = self.scorer.calculate_trust_score(
+                    self.sample_review,
+                    sentiment,
+                    authenticity,
+                    fake,
+                    reviewer,
+                    location,
+                )
+
+                self.assertIsInstance(result, float)
+                self.assertGreaterEqual(result, 0.0)
+                self.assertLessEqual(result, 1.0)
 
     def test_trusted_vs_suspicious_reviewer(self) -> None:
         """Test that trusted reviewers get higher trust scores."""
@@ -120,6 +203,45 @@ class TestTrustScorer(unittest.TestCase):
         self.assertEqual(self.scorer.get_trust_category(medium_score), "moderate")
         self.assertEqual(self.scorer.get_trust_category(low_score), "untrusted")
 
+    def test_get_trust_category_boundaries(self) -> None:
+        """Test that category floors are inclusive for single and batch calls."""
+        scores = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
+        expected = [
+            "untrusted",
+            "low_trust",
+            "moderate",
+            "trusted",
+            "highly_trusted",
+            "highly_trusted",
+        ]
+
+        self.assertEqual([self.scorer.get_trust_category(s) for s in scores], expected)
+        self.assertEqual(self.scorer.get_trust_categories(scores), expected)
+
+    def test_get_trust_category_non_finite(self) -> None:
+        """Test that non-finite scores fall in the lowest category."""
+        scores = [float("nan"), float("inf"), float("-inf")]
+        for score in scores:
+            with self.subTest(score=score):
+                self.assertEqual(self.scorer.get_trust_category(score), "untrusted")
+
+        self.assertEqual(
+            self.scorer.get_trust_categories(scores + [0.9]),
+            ["untrusted", "untrusted", "untrusted", "highly_trusted"],
+        )
+
+    def test_reviewer_credibility_tier_boundaries(self) -> None:
+        """Test that credibility tiers only step up strictly above each bin."""
+        at_bins = {"account_age_days": 365, "review_count": 50}
+        above_bins = {"account_age_days": 366, "review_count": 51}
+
+        # Using # type: ignore to suppress protected method warnings for testing
+        lower = self.scorer._calculate_reviewer_credibility(at_bins)  # type: ignore
+        higher = self.scorer._calculate_reviewer_credibility(above_bins)  # type: ignore
+
+        # Age and history each weigh 0.3 and move from 0.8 to 1.0
+        self.assertAlmostEqual(higher - lower, 0.12)
+
     def test_get_trust_explanation(self) -> None:
         """Test trust score explanation generation."""
         components = {
@@ -161,6 +283,17 @@ class TestTrustScorer(unittest.TestCase):
         self.assertGreaterEqual(result, 0.0)
         self.assertLessEqual(result, 1.0)
 
+    def test_calculate_location_trust_trims_outliers(self) -> None:
+        """Test that the top and bottom 5% of scores are ignored."""
+        scores = [0.6] * 38 + [0.0, 1.0]
+        review_results = [
+            {"success": True, "trust_score": score} for score in reversed(scores)
+        ]
+        result = self.scorer.calculate_location_trust(review_results)
+
+        # 40 reviews: trimmed mean is 0.6 and confidence weight is 0.8
+        self.assertAlmostEqual(result, 0.6 * 0.8 + 0.5 * 0.2)
+
     def test_calculate_location_trust_empty_results(self) -> None:
         """Test location trust calculation with empty results."""
         result = self.scorer.calculate_location_trust([])
@@ -179,38 +312,13 @@ class TestTrustScorer(unittest.TestCase):
         self.assertEqual(result, 0.5)  # Default when no successful results
 
     def test_score_consistency(self) -> None:
-        """Test that multiple calculations are consistent."""
-        score1 = self.scorer.calculate_trust_score(
+        """Test that the sample inputs score the recorded value."""
+        score = self.scorer.calculate_trust_score(
             self.sample_review, self.sample_sentiment, 0.8, 0.2
         )
 
-        score2 = self.scorer.calculate_trust_score(
-            self.sample_review, self.sample_sentiment, 0.8, 0.2
-        )
-
-        self.assertEqual(score1, score2)
-
-    def test_score_bounds(self) -> None:
-        """Test that trust scores stay within bounds."""
-        # Test extreme values
-        extreme_high = self.scorer.calculate_trust_score(
-            self.sample_review,
-            {"polarity": 1.0, "subjectivity": 0.0, "confidence": 1.0},
-            1.0,  # perfect authenticity
-            0.0,  # no fake probability
-        )
-
-        extreme_low = self.scorer.calculate_trust_score(
-            self.sample_review,
-            {"polarity": -1.0, "subjectivity": 1.0, "confidence": 0.0},
-            0.0,  # no authenticity
-            1.0,  # completely fake
-        )
-
-        self.assertGreaterEqual(extreme_high, 0.0)
-        self.assertLessEqual(extreme_high, 1.0)
-        self.assertGreaterEqual(extreme_low, 0.0)
-        self.assertLessEqual(extreme_low, 1.0)
+        # Pinned so refactors of the scoring path cannot drift silently
+        self.assertAlmostEqual(score, self.EXPECTED_CONSISTENCY_SCORE, places=6)
 
     def test_error_handling(self) -> None:
         """Test error handling with invalid inputs."""
@@ -223,6 +331,51 @@ class TestTrustScorer(unittest.TestCase):
         self.assertGreaterEqual(result, 0.0)
         self.assertLessEqual(result, 1.0)
 
+    def test_non_finite_score_is_neutral(self) -> None:
+        """Test that a NaN factor scores as neutral rather than fully trusted."""
+        result = self.scorer.calculate_trust_score(
+            self.sample_review, self.sample_sentiment, float("nan"), 0.2
+        )
+        batch = self.scorer.calculate_trust_scores_batch(
+            [float("nan"), 0.8],
+            [0.7, 0.7],
+            [1.0, 1.0],
+            [0.9, 0.9],
+            [1.0, 1.0],
+            [0.2, 0.2],
+        )
+
+        self.assertEqual(result, 0.5)
+        self.assertEqual(batch[0], 0.5)
+        self.assertGreater(batch[1], 0.5)
+
+    def test_error_handling_malformed_reviewer_data(self) -> None:
+        """Test that helper errors surface at the calculate_trust_score boundary."""
+        result = self.scorer.calculate_trust_score(
+            self.sample_review,
+            self.sample_sentiment,
+            0.8,
+            0.2,
+            {"account_age_days": "unknown"},
+        )
+
+        self.assertEqual(result, 0.5)
+
+    def test_temporal_consistency_clustered_iso_timestamps(self) -> None:
+        """Test that same-day ISO timestamps count as clustered reviews."""
+        reviewer_data = {
+            "account_age_days": 365,
+            "review_count": 6,
+            "recent_reviews": [
+                {"timestamp": f"2025-08-01T{hour:02d}:00:00"} for hour in range(6)
+            ],
+        }
+
+        # Using # type: ignore to suppress protected method warnings for testing
+        result = self.scorer._assess_temporal_consistency(reviewer_data, None)  # type: ignore
+
+        self.assertAlmostEqual(result, 0.7)
+
     def test_sentiment_quality_assessment(self) -> None:
         """Test sentiment quality assessment (protected method)."""
         # Using # type: ignore to suppress protected method warnings for testing
@@ -241,6 +394,19 @@ class TestTrustScorer(unittest.TestCase):
         self.assertGreaterEqual(result, 0.0)
         self.assertLessEqual(result, 1.0)
 
+    def test_repeat_content_quality_uses_cache(self) -> None:
+        """Test that scoring the same text twice assesses its content once."""
+        scorer = TrustScorer()
+        for _ in range(2):
+            scorer.calculate_trust_score(
+                self.sample_review, self.sample_sentiment, 0.8, 0.2
+            )
+
+        # Using # type: ignore to suppress protected member warnings for testing
+        info = scorer._content_quality_cached.cache_info()  # type: ignore
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
     def test_reviewer_credibility_calculation(self) -> None:
         """Test reviewer credibility calculation (protected method)."""
         # Using # type: ignore to suppress protected method warnings for testing
@@ -4,12 +4,21 @@ Integration-like tests for main exposed API functions.
 
 import unittest
 from typing import Any, Dict, List
+from unittest.mock import patch
+
+import numpy as np
+
+import main
+from main import (
+    _data_processor,
+    analyze_bulk_reviews,
+    analyze_review,
+    get_trust_dashboard_data,
+)
 
 
 class TestMainAPI(unittest.TestCase):
     def test_analyze_review_basic(self) -> None:
-        from main import analyze_review
-
         result = analyze_review("Great food and excellent service.")
         self.assertIsInstance(result, dict)
         self.assertTrue(result.get("success"))
@@ -17,9 +26,17 @@ class TestMainAPI(unittest.TestCase):
         self.assertGreaterEqual(result["trust_score"], 0.0)
         self.assertLessEqual(result["trust_score"], 1.0)
 
-    def test_analyze_bulk_reviews(self) -> None:
-        from main import analyze_bulk_reviews
+    def test_analyze_review_results_independent(self) -> None:
+        reviewer = {"account_age_days": 100, "review_count": 10}
+        first = main.analyze_review("Fresh bread daily.", reviewer)
+        first["trust_score"] = -1.0
+        first["sentiment_score"].clear()
+        second = main.analyze_review("Fresh bread daily.", dict(reviewer))
+
+        self.assertGreaterEqual(second["trust_score"], 0.0)
+        self.assertTrue(second["sentiment_score"])
 
+    def test_analyze_bulk_reviews(self) -> None:
         data: List[Dict[str, Any]] = [
             {
                 "text": "Amazing experience!",
@@ -38,14 +55,64 @@ class TestMainAPI(unittest.TestCase):
         self.assertIn("individual_results", result)
         self.assertEqual(len(result["individual_results"]), 2)
 
-    def test_get_trust_dashboard_data(self) -> None:
-        from main import get_trust_dashboard_data
+    def test_analyze_bulk_reviews_isolates_bad_review(self) -> None:
+        result = analyze_bulk_reviews([{"text": "Lovely pasta."}, {"text": 42}])
+        self.assertTrue(result.get("success"))
+        outcomes = [r["success"] for r in result["individual_results"]]
+        self.assertEqual(outcomes, [True, False])
+        self.assertEqual(len(result["trust_trends"]), 1)
+
+    def test_analyze_bulk_reviews_batches_valid_reviews(self) -> None:
+        reviews: List[Dict[str, Any]] = [
+            {"text": "Lovely pasta."},
+            {"text": "Great coffee.", "reviewer_data": "not a dict"},
+            {"text": "Friendly staff."},
+        ]
+        with patch("main.analyze_review", wraps=main.analyze_review) as single:
+            result = analyze_bulk_reviews(reviews)
 
+        self.assertEqual(single.call_count, 1)
+        self.assertEqual(single.call_args.args[0], "Great coffee.")
+        self.assertEqual(len(result["individual_results"]), 3)
+
+    def test_analyze_bulk_reviews_logs_batch_failure(self) -> None:
+        reviews = [{"text": "Lovely pasta."}, {"text": "Friendly staff."}]
+        with patch("main._analyze_reviews_batch", side_effect=RuntimeError("boom")):
+            with self.assertLogs("review_trust_system.main", "ERROR") as logs:
+                result = analyze_bulk_reviews(reviews)
+
+        self.assertIn("boom", logs.output[0])
+        outcomes = [r["success"] for r in result["individual_results"]]
+        self.assertEqual(outcomes, [True, True])
+
+    def test_analyze_bulk_reviews_without_timestamps(self) -> None:
+        reviews = [{"text": f"Solid lunch spot number {i}."} for i in range(12)]
+
+        result = analyze_bulk_reviews(reviews)
+        self.assertTrue(result.get("success"))
+        self.assertEqual(len(result["individual_results"]), 12)
+        self.assertEqual(result["anomalies"], [])
+
+    def test_get_trust_dashboard_data(self) -> None:
         result = get_trust_dashboard_data("loc_123")
         self.assertTrue(result.get("success"))
         self.assertIn("trend_data", result)
-        for item in result["trend_data"]:
-            self.assertGreaterEqual(item["trust_score"], 0.0)
-            self.assertLessEqual(item["trust_score"], 1.0)
-            self.assertGreaterEqual(item["average_rating"], 1.0)
-            self.assertLessEqual(item["average_rating"], 5.0)
+        trend_data = result["trend_data"]
+        trust_scores = np.fromiter((i["trust_score"] for i in trend_data), float)
+        ratings = np.fromiter((i["average_rating"] for i in trend_data), float)
+        self.assertTrue(np.all((trust_scores >= 0.0) & (trust_scores <= 1.0)))
+        self.assertTrue(np.all((ratings >= 1.0) & (ratings <= 5.0)))
+
+    def test_services_built_once(self) -> None:
+        _data_processor.cache_clear()
+        self.addCleanup(_data_processor.cache_clear)
+        with patch("main.DataProcessor") as processor_cls:
+            first = _data_processor()
+            second = _data_processor()
+
+        processor_cls.assert_called_once_with()
+        self.assertIs(first, second)
+
+    def test_service_globals_are_shared_instances(self) -> None:
+        self.assertIs(main.data_processor, _data_processor())
+        self.assertIs(main.fake_detector, main._fake_detector())
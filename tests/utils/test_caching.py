@@ -0,0 +1,151 @@
+"""
+Unit tests for the caching helpers.
+"""
+
+import gc
+import unittest
+import weakref
+from typing import Any, Dict, List
+
+from backend.utils.caching import FrozenArg, cached_method, freeze, thaw
+
+
+class TestFreeze(unittest.TestCase):
+    """Test cases for the freeze function."""
+
+    def test_freeze_nested_structure(self) -> None:
+        """Test that nested dicts and lists become hashable."""
+        data: Dict[str, Any] = {
+            "account_age_days": 10,
+            "recent_reviews": [{"date": "2025-01-01"}, {"date": "2025-01-02"}],
+            "tags": {"new", "unverified"},
+        }
+
+        frozen = freeze(data)
+
+        self.assertIsInstance(hash(frozen), int)
+
+    def test_freeze_ignores_key_order(self) -> None:
+        """Test that dicts with the same items freeze to equal values."""
+        self.assertEqual(freeze({"a": 1, "b": 2}), freeze({"b": 2, "a": 1}))
+
+    def test_freeze_unhashable_value(self) -> None:
+        """Test that objects which cannot be hashed raise TypeError."""
+        with self.assertRaises(TypeError):
+            freeze({"data": bytearray(b"abc")})
+
+    def test_freeze_keeps_container_types(self) -> None:
+        """Test that containers with equal items but different types differ."""
+        self.assertNotEqual(freeze([1, 2]), freeze((1, 2)))
+        self.assertNotEqual(freeze({"a": 1}), freeze({("a", 1)}))
+
+
+class TestThaw(unittest.TestCase):
+    """Test cases for the thaw function."""
+
+    def test_thaw_round_trip(self) -> None:
+        """Test that thawing a snapshot rebuilds an equal structure."""
+        data: Dict[str, Any] = {
+            "recent_reviews": [{"date": "2025-01-01"}, {"date": "2025-01-02"}],
+            "tags": {"new", "unverified"},
+            "coords": (1.5, 2.5),
+            "flags": frozenset({"a"}),
+            "note": None,
+        }
+
+        self.assertEqual(thaw(freeze(data)), data)
+
+
+class TestFrozenArg(unittest.TestCase):
+    """Test cases for the FrozenArg wrapper."""
+
+    def test_equal_contents_are_equal(self) -> None:
+        """Test that wrappers around equal data compare and hash equally."""
+        first = FrozenArg({"review_count": 5, "recent_reviews": []})
+        second = FrozenArg({"recent_reviews": [], "review_count": 5})
+
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+
+    def test_snapshot_survives_mutation(self) -> None:
+        """Test that mutating the wrapped value does not change equality."""
+        data: Dict[str, Any] = {"review_count": 5}
+        wrapped = FrozenArg(data)
+        data["review_count"] = 50
+
+        self.assertEqual(wrapped, FrozenArg({"review_count": 5}))
+        self.assertNotEqual(wrapped, FrozenArg(data))
+
+    def test_wraps_none(self) -> None:
+        """Test that None can be wrapped and keeps its value."""
+        wrapped = FrozenArg(None)
+
+        self.assertIsNone(wrapped.value)
+        self.assertEqual(wrapped, FrozenArg(None))
+
+    def test_value_is_rebuilt_from_snapshot(self) -> None:
+        """Test that the value is a fresh copy, not the caller's object."""
+        data: Dict[str, Any] = {"recent_reviews": [{"date": "2025-01-01"}]}
+        wrapped = FrozenArg(data)
+        data["recent_reviews"].append({"date": "2025-01-02"})
+
+        value = wrapped.value
+        value["recent_reviews"].clear()
+
+        self.assertIsNot(value, data)
+        self.assertEqual(wrapped.value, {"recent_reviews": [{"date": "2025-01-01"}]})
+
+    def test_does_not_keep_value_alive(self) -> None:
+        """Test that wrapping an object holds no reference to it."""
+
+        class Payload(dict):
+            __hash__ = None  # type: ignore
+
+        payload = Payload(review_count=5)
+        ref = weakref.ref(payload)
+        wrapped = FrozenArg(payload)
+        del payload
+
+        self.assertIsNone(ref())
+        self.assertEqual(wrapped.value, {"review_count": 5})
+
+
+class _Counter:
+    """Small class with a memoised method for the cached_method tests."""
+
+    def __init__(self) -> None:
+        self.calls: List[int] = []
+        self.double_cached = cached_method(self.double, 8)
+
+    def double(self, number: int) -> int:
+        self.calls.append(number)
+        return number * 2
+
+
+class TestCachedMethod(unittest.TestCase):
+    """Test cases for the cached_method helper."""
+
+    def test_repeats_hit_cache(self) -> None:
+        """Test that repeated arguments call the method once."""
+        counter = _Counter()
+
+        self.assertEqual(counter.double_cached(3), 6)
+        self.assertEqual(counter.double_cached(3), 6)
+        self.assertEqual(counter.calls, [3])
+
+    def test_no_reference_cycle(self) -> None:
+        """Test that the instance is freed without the cycle collector."""
+        counter = _Counter()
+        counter.double_cached(3)
+        ref = weakref.ref(counter)
+
+        gc.disable()
+        try:
+            del counter
+            self.assertIsNone(ref())
+        finally:
+            gc.enable()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,18 +2,27 @@
 Unit tests for the DataProcessor utility.
 """
 
+import json
+import re
 import unittest
+from datetime import datetime, timedelta
 from typing import Dict, Any
 
-from backend.utils.data_processor import DataProcessor
+import numpy as np
+
+from backend.utils import data_processor
+from backend.utils.data_processor import DataProcessor, _trust_walk
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 
 class TestDataProcessor(unittest.TestCase):
     """Test cases for the DataProcessor class."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.processor = DataProcessor()
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up a seeded processor shared by every test in the class."""
+        cls.processor = DataProcessor(seed=0)
 
     def test_initialisation(self) -> None:
         """Test that DataProcessor initialises correctly."""
@@ -51,6 +60,20 @@ class TestDataProcessor(unittest.TestCase):
         self.assertIsInstance(result, list)
         self.assertEqual(len(result), days)
 
+    def test_generate_trend_data_keep_prob(self) -> None:
+        """Test that keep_prob thins trend data to evenly spaced days."""
+        result = self.processor.generate_trend_data(days=40, keep_prob=0.25)
+
+        self.assertEqual(len(result), 10)
+        dates = [datetime.strptime(t["date"], "%Y-%m-%d") for t in result]
+        gaps = {(b - a).days for a, b in zip(dates, dates[1:])}
+        self.assertEqual(gaps, {4})
+
+    def test_generate_trend_data_invalid_keep_prob(self) -> None:
+        """Test that keep_prob outside (0, 1] is rejected."""
+        with self.assertRaises(ValueError):
+            self.processor.generate_trend_data(keep_prob=0.0)
+
     def test_get_sample_trusted_reviews_default(self) -> None:
         """Test trusted reviews generation with default count."""
         result = self.processor.get_sample_trusted_reviews()
@@ -123,12 +146,23 @@ class TestDataProcessor(unittest.TestCase):
 
     def test_get_sample_reviewer_activity_sorted(self) -> None:
         """Test that reviewer activity is sorted by date (descending)."""
-        result = self.processor.get_sample_reviewer_activity()
+        result = self.processor.get_sample_reviewer_activity(count=50)
+        dates = np.array([a["date"] for a in result], dtype="datetime64[D]")
+
+        # Parsed dates, so the order is chronological rather than lexicographic
+        self.assertTrue(np.all(np.diff(dates) <= np.timedelta64(0, "D")))
+
+    def test_sample_review_dates_in_range(self) -> None:
+        """Test that sample review dates and timestamps fall in the past window."""
+        today = datetime.now().date()
 
-        if len(result) > 1:
-            # Check that dates are in descending order
-            for i in range(len(result) - 1):
-                self.assertGreaterEqual(result[i]["date"], result[i + 1]["date"])
+        for review in self.processor.get_sample_trusted_reviews(count=20):
+            age = today - datetime.strptime(review["date"], "%Y-%m-%d").date()
+            self.assertTrue(timedelta(days=1) <= age <= timedelta(days=30))
+
+        for review in self.processor.generate_sample_reviews(count=20):
+            age = today - datetime.fromisoformat(review["timestamp"]).date()
+            self.assertTrue(timedelta(days=1) <= age <= timedelta(days=365))
 
     def test_generate_sample_reviews_default(self) -> None:
         """Test sample reviews generation with default count."""
@@ -177,6 +211,12 @@ class TestDataProcessor(unittest.TestCase):
         self.assertEqual(result["total_reviews"], 4)
         self.assertGreaterEqual(result["average_trust_score"], 0.0)
         self.assertLessEqual(result["average_trust_score"], 1.0)
+        self.assertEqual(
+            result["trust_distribution"],
+            {"high_trust": 2, "medium_trust": 1, "low_trust": 1},
+        )
+        self.assertEqual(result["rating_distribution"]["4_star"], 1)
+        self.assertEqual(result["rating_distribution"]["1_star"], 0)
 
     def test_calculate_statistics_empty_data(self) -> None:
         """Test statistics calculation with empty data."""
@@ -185,6 +225,22 @@ class TestDataProcessor(unittest.TestCase):
         self.assertIsInstance(result, dict)
         self.assertEqual(len(result), 0)
 
+    def test_calculate_statistics_non_finite_scores(self) -> None:
+        """Test that NaN and infinite trust scores fall in no trust bucket."""
+        reviews: list[Dict[str, Any]] = [
+            {"trust_score": 0.9, "rating": 5},
+            {"trust_score": float("nan"), "rating": 3},
+            {"trust_score": float("inf"), "rating": 4},
+            {"trust_score": 0.2, "rating": 1},
+        ]
+
+        result = self.processor.calculate_statistics(reviews)
+
+        self.assertEqual(
+            result["trust_distribution"],
+            {"high_trust": 1, "medium_trust": 0, "low_trust": 1},
+        )
+
     def test_export_analysis_results_default_filename(self) -> None:
         """Test analysis results export with default filename."""
         sample_results: list[Dict[str, Any]] = [
@@ -206,6 +262,20 @@ class TestDataProcessor(unittest.TestCase):
         self.assertGreaterEqual(summary["average_trust_score"], 0.0)
         self.assertLessEqual(summary["average_trust_score"], 1.0)
 
+    def test_export_summary_ignores_missing_scores_in_counts(self) -> None:
+        """Test that results without a trust score are neither flagged nor trusted."""
+        sample_results: list[Dict[str, Any]] = [
+            {"trust_score": 0.9},
+            {"trust_score": 0.1},
+            {"error": "analysis failed"},
+        ]
+
+        summary = self.processor.export_analysis_results(sample_results)["summary"]
+
+        self.assertEqual(summary["suspicious_count"], 1)
+        self.assertEqual(summary["trusted_count"], 1)
+        self.assertAlmostEqual(summary["average_trust_score"], 1.0 / 3)
+
     def test_export_analysis_results_custom_filename(self) -> None:
         """Test analysis results export with custom filename."""
         sample_results: list[Dict[str, Any]] = [{"trust_score": 0.8}]
@@ -217,14 +287,90 @@ class TestDataProcessor(unittest.TestCase):
         self.assertIn("metadata", result)
         self.assertEqual(result["metadata"]["filename"], filename)
 
+    def test_export_analysis_results_bytes(self) -> None:
+        """Test that the byte export decodes to the dict export."""
+        sample_results: list[Dict[str, Any]] = [
+            {"trust_score": 0.8, "text": "Great place!"},
+            {"trust_score": np.float64(0.2), "text": "Awful."},
+        ]
+
+        encoded = self.processor.export_analysis_results_bytes(
+            sample_results, "export.json"
+        )
+        decoded = json.loads(encoded)
+
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(decoded["summary"]["suspicious_count"], 1)
+        self.assertEqual(decoded["detailed_results"][1]["trust_score"], 0.2)
+        self.assertEqual(decoded["metadata"]["filename"], "export.json")
+
+    def test_export_bytes_non_finite_scores_json(self) -> None:
+        """Test that the json encoder writes non-finite scores as null."""
+        data = {"scores": [float("nan"), np.float32("inf"), 0.5], "avg": np.nan}
+
+        # Using # type: ignore to suppress protected member warnings for testing
+        encoded = data_processor._dumps_json(data)  # type: ignore
+
+        self.assertNotIn(b"NaN", encoded)
+        self.assertEqual(
+            json.loads(encoded), {"scores": [None, None, 0.5], "avg": None}
+        )
+
+    @unittest.skipUnless(data_processor.orjson, "orjson is not installed")
+    def test_export_bytes_backends_agree(self) -> None:
+        """Test that orjson and json encode non-finite scores the same way."""
+        data = {"scores": np.array([np.nan, 0.25]), "avg": float("-inf")}
+
+        # Using # type: ignore to suppress protected member warnings for testing
+        self.assertEqual(
+            json.loads(data_processor._dumps(data)),  # type: ignore
+            json.loads(data_processor._dumps_json(data)),  # type: ignore
+        )
+
+    def test_export_bytes_empty_results(self) -> None:
+        """Test that an empty export's NaN average decodes as strict JSON."""
+        with self.assertWarns(RuntimeWarning):
+            encoded = self.processor.export_analysis_results_bytes([])
+
+        decoded = json.loads(encoded, parse_constant=self.fail)
+        self.assertIsNone(decoded["summary"]["average_trust_score"])
+
     def test_trend_data_date_format(self) -> None:
         """Test that trend data has proper date format."""
         result = self.processor.generate_trend_data(days=3)
 
         for trend in result:
-            date_str = trend["date"]
             # Should be in YYYY-MM-DD format
-            self.assertRegex(date_str, r"^\d{4}-\d{2}-\d{2}$")
+            self.assertRegex(trend["date"], _DATE_RE)
+
+    def test_trend_data_consecutive_days(self) -> None:
+        """Test that trend dates are consecutive and end yesterday."""
+        result = self.processor.generate_trend_data(days=10)
+        dates = [datetime.strptime(t["date"], "%Y-%m-%d").date() for t in result]
+
+        for previous, current in zip(dates, dates[1:]):
+            self.assertEqual(current - previous, timedelta(days=1))
+        self.assertEqual(dates[-1], datetime.now().date() - timedelta(days=1))
+
+    def test_trust_walk_clamps_and_carries_drift(self) -> None:
+        """Test that the trust recurrence clamps each day and carries drift."""
+        result = _trust_walk([0.5, -0.1, -2.0], [0.0, 0.05, 0.0], [-0.1, 0.0, 0.0])
+
+        # 0.7 + 0.5 clamps to 1.0, then (1.0 - 0.1) - 0.1 + 0.05, then floor
+        self.assertEqual(result, [1.0, 0.85, 0.0])
+
+    def test_seeded_processors_repeat_data(self) -> None:
+        """Test that processors with the same seed generate the same data."""
+        first = DataProcessor(seed=7).generate_trend_data(days=14)
+        second = DataProcessor(seed=7).generate_trend_data(days=14)
+
+        self.assertEqual(first, second)
+
+        first_reviews = DataProcessor(seed=7).generate_sample_reviews(count=10)
+        second_reviews = DataProcessor(seed=7).generate_sample_reviews(count=10)
+        for review_a, review_b in zip(first_reviews, second_reviews):
+            self.assertEqual(review_a["text"], review_b["text"])
+            self.assertEqual(review_a["reviewer_data"], review_b["reviewer_data"])
 
     def test_reviewer_data_structure(self) -> None:
         """Test that generated reviewer data has proper structure."""
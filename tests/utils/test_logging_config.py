@@ -0,0 +1,81 @@
+"""
+Unit tests for the logging configuration helpers.
+"""
+
+import logging
+import os
+import tempfile
+import unittest
+
+from backend.utils import logging_config
+from backend.utils.logging_config import get_logger, setup_logging, stop_file_logging
+
+
+class TestSetupLogging(unittest.TestCase):
+    """Test cases for the setup_logging function."""
+
+    def setUp(self) -> None:
+        """Start each test from an unconfigured application logger."""
+        self.logger = logging.getLogger("review_trust_system")
+        self.saved_handlers = self.logger.handlers[:]
+        self.saved_level = self.logger.level
+        self.logger.handlers.clear()
+
+    def tearDown(self) -> None:
+        """Stop any log file listener and restore the application logger."""
+        stop_file_logging()
+        self.logger.handlers[:] = self.saved_handlers
+        self.logger.setLevel(self.saved_level)
+
+    def test_repeated_setup_adds_handlers_once(self) -> None:
+        """Test that configuring twice does not duplicate handlers."""
+        setup_logging()
+        setup_logging()
+
+        self.assertEqual(len(self.logger.handlers), 1)
+
+    def test_unknown_level_defaults_to_info(self) -> None:
+        """Test that an unrecognised level name falls back to INFO."""
+        logger = setup_logging(log_level="verbose")
+
+        self.assertEqual(logger.level, logging.INFO)
+
+    def test_later_call_applies_level_and_log_file(self) -> None:
+        """Test that a later call still sets the level and adds a new log file."""
+        setup_logging()
+        with tempfile.TemporaryDirectory() as tmp:
+            log_file = os.path.join(tmp, "logs", "app.log")
+            logger = setup_logging(log_level="debug", log_file=log_file)
+            setup_logging(log_level="debug", log_file=log_file)
+
+            self.assertEqual(logger.level, logging.DEBUG)
+            self.assertEqual(len(logger.handlers), 2)
+            self.assertTrue(os.path.exists(log_file))
+
+            # Close the file before the temporary directory is removed
+            stop_file_logging()
+            self.assertEqual(len(logger.handlers), 1)
+
+    def test_new_log_file_replaces_previous_listener(self) -> None:
+        """Test that switching log files stops the old listener and closes its file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            setup_logging(log_file=os.path.join(tmp, "first.log"))
+            # Using # type: ignore to suppress protected member warnings for testing
+            first_listener = logging_config._active_listener  # type: ignore
+            first_file = first_listener.handlers[0]
+
+            setup_logging(log_file=os.path.join(tmp, "second.log"))
+
+            self.assertIsNone(first_listener._thread)  # type: ignore
+            self.assertIsNone(first_file.stream)
+            self.assertEqual(len(self.logger.handlers), 2)
+            self.assertIsNot(logging_config._active_listener, first_listener)  # type: ignore
+            stop_file_logging()
+
+    def test_get_logger_is_child_of_app_logger(self) -> None:
+        """Test that module loggers propagate to the application logger."""
+        self.assertIs(get_logger("main").parent, self.logger)
+
+
+if __name__ == "__main__":
+    unittest.main()